@@ -2,8 +2,59 @@
 from AlgorithmImports import *
 import numpy as np
 from collections import deque
+from numba import njit
 # endregion
 
+# Order of the per-regime parameter vectors
+PARAM_FIELDS = ('z_entry', 'z_exit', 'stop_loss_z', 'lookback', 'max_holding_days')
+
+
+# Eager signature: compiled at import and cached on disk, so backtests skip the JIT warm-up
+@njit('Tuple((f8[:], f8[:]))(i8[:], f8[:], f8[:], f8[:, :], i8[:], f8[:, :], f8[:, :], i8[:], i8, i8)',
+      fastmath=True, cache=True, boundscheck=False)
+def update_pair_zscores(rows, long_p, short_p, spread_buf, spread_head,
+                        spread_sum, spread_sumsq, lookbacks, k, min_count):
+    """
+    Append today's spread for each active pair and return (z_scores, spreads).
+
+    Rows with a non-positive price are skipped. A pair gets z = NaN until it
+    has min_count spreads in window k, or while its variance is zero.
+    """
+    n = len(rows)
+    capacity = spread_buf.shape[1]
+    z_scores = np.full(n, np.nan)
+    spreads = np.full(n, np.nan)
+
+    for j in range(n):
+        if long_p[j] <= 0 or short_p[j] <= 0:
+            continue
+
+        i = rows[j]
+        spread = np.log(long_p[j] / short_p[j])
+        spreads[j] = spread
+        head = spread_head[i]
+
+        # Roll every lookback window: evict the leaving value (read before the slot is reused)
+        for c in range(len(lookbacks)):
+            evicted = spread_buf[i, (head - lookbacks[c]) % capacity] if head >= lookbacks[c] else 0.0
+            spread_sum[i, c] += spread - evicted
+            spread_sumsq[i, c] += spread * spread - evicted * evicted
+        spread_buf[i, head % capacity] = spread
+        spread_head[i] = head + 1
+
+        count = min(lookbacks[k], head + 1)
+        if count < min_count:
+            continue
+
+        mean = spread_sum[i, k] / count
+        var = (spread_sumsq[i, k] - spread_sum[i, k] * mean) / (count - 1)
+        if var <= 0:
+            continue
+
+        z_scores[j] = (spread - mean) / np.sqrt(var)
+
+    return z_scores, spreads
+
 
 class RegimeDiversifiedStatArb(QCAlgorithm):
     """
@@ -150,6 +201,41 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
         # Initialize pair data storage
         self.pair_data = {}
         all_pairs = self.qt_champion_pairs + self.zirp_pairs
+        self.pair_index = {pair['name']: i for i, pair in enumerate(all_pairs)}
+        
+        # Per-regime (pairs, parameter vector in PARAM_FIELDS order, allocation),
+        # built once instead of every bar
+        self.regime_configs = {
+            # High dispersion - use champions
+            'QT': (self.qt_champion_pairs, self.param_vector(self.qt_params), 0.70),
+            # Low dispersion - use ZIRP pairs
+            'ZIRP': (self.zirp_pairs, self.param_vector(self.zirp_params), 0.40),
+            # Use both with reduced sizing
+            'TRANSITIONAL': (all_pairs, self.param_vector(self.transition_params), 0.50),
+        }
+        self.regime_pair_rows = {
+            regime: np.array([self.pair_index[p['name']] for p in pairs], dtype=np.int64)
+            for regime, (pairs, _, _) in self.regime_configs.items()
+        }
+        
+        # Spread history ring buffer (one row per pair); spread_head counts writes
+        self.max_lookback = 60
+        self.spread_buf = np.empty((len(all_pairs), self.max_lookback))
+        self.spread_head = np.zeros(len(all_pairs), dtype=np.int64)
+        
+        # Running window sums, one column per regime lookback, for O(1) z-scores
+        self.lookbacks = np.array(sorted({p['lookback'] for p in
+                                          (self.qt_params, self.zirp_params, self.transition_params)}),
+                                  dtype=np.int64)
+        self.lookback_col = {int(lb): k for k, lb in enumerate(self.lookbacks)}
+        self.spread_sum = np.zeros((len(all_pairs), len(self.lookbacks)))
+        self.spread_sumsq = np.zeros((len(all_pairs), len(self.lookbacks)))
+        
+        # Open position state, one slot per pair (entry_day is a date ordinal)
+        self.pos_open = np.zeros(len(all_pairs), dtype=bool)
+        self.entry_day = np.full(len(all_pairs), -1, dtype=np.int64)
+        self.entry_z = np.zeros(len(all_pairs))
+        self.entry_spread = np.zeros(len(all_pairs))
         
         for pair in all_pairs:
             # Add securities
@@ -164,19 +250,29 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
                 'short_ticker': pair['short'],
                 'description': pair['description'],
                 'regime': pair['regime'],
-                'spread_history': deque(maxlen=60),  # Max lookback
-                'position_open': False,
-                'entry_date': None,
-                'entry_z_score': None,
-                'entry_spread': None,
-                'spread_mean': None,
-                'spread_std': None,
                 'active': False  # Will be set based on regime
             }
         
         # Initialize regime detection
         self.initialize_regime_detection()
         
+        # Price prefetch layout: one column per distinct pair-leg / regime symbol
+        pair_legs = list(self.pair_data.values())
+        self.price_symbols = list(dict.fromkeys(
+            [data['long_symbol'] for data in pair_legs]
+            + [data['short_symbol'] for data in pair_legs]
+            + list(self.sector_etfs.values())
+            + [symbol for symbol in (self.vix, self.tlt, self.vxx) if symbol]
+        ))
+        self.price_col = {symbol: col for col, symbol in enumerate(self.price_symbols)}
+        self.prices = np.zeros(len(self.price_symbols))
+        self.pair_long_cols = np.array([self.price_col[data['long_symbol']] for data in pair_legs], dtype=np.int64)
+        self.pair_short_cols = np.array([self.price_col[data['short_symbol']] for data in pair_legs], dtype=np.int64)
+        self.sector_cols = np.array([self.price_col[symbol] for symbol in self.sector_etfs.values()], dtype=np.int64)
+        self.vix_col = self.price_col[self.vix] if self.vix else None
+        self.tlt_col = self.price_col[self.tlt]
+        self.vxx_col = self.price_col[self.vxx] if self.vxx else None
+        
         # Warm up period
         self.set_warm_up(60)
         
@@ -243,15 +339,59 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
             self.vxx = None
         
         # Historical data
-        self.sector_history = {ticker: deque(maxlen=60) for ticker in self.sector_etfs.keys()}
-        self.vix_history = deque(maxlen=252)
-        self.regime_history = deque(maxlen=20)
+        # Sector price ring matrix (one row per sector, 60 columns); sector_head counts writes
+        self.sector_buf = np.zeros((len(self.sector_etfs), 60))
+        self.sector_head = 0
+        # VIX ring buffer (same 252-day capacity as before); vix_head counts writes
+        self.vix_buf = np.zeros(252)
+        self.vix_head = 0
+        # Last 10 raw scores plus their running sum for the smoothed score
+        self.regime_history = deque(maxlen=10)
+        self.regime_sum = 0.0
+        
+        # Upper-triangle (i < j) indices of the sector correlation matrix
+        self.corr_iu = np.triu_indices(len(self.sector_etfs), k=1)
         
         # Regime state
         self.current_regime = "TRANSITIONAL"
         self.regime_score = 50
         self.last_regime = None
         
+        # Score component lookup tables (metric -> component via np.searchsorted)
+        self.vix_thresholds = self.threshold_cutoffs(13, 15, 18, 22)
+        self.vix_components = np.array([-4, -2, 0, 2, 4], dtype=float)
+        self.corr_thresholds = self.threshold_cutoffs(0.40, 0.50, 0.55, 0.65)
+        self.corr_components = np.array([6.25, 3.75, 0, -3.75, -6.25])
+        self.rate_thresholds = self.threshold_cutoffs(0.95, 1.0, 1.0, 1.05)  # TLT / SMA ratio
+        self.rate_components = np.array([5, 2.5, 0, -2.5, -5])
+        self.term_thresholds = self.threshold_cutoffs(0.85, 0.95, 1.05, 1.15)
+        self.term_components = np.array([-3, -1.5, 0, 1.5, 3])
+        self.disp_thresholds = self.threshold_cutoffs(0.03, 0.05, 0.07, 0.10)
+        self.disp_components = np.array([-3, -1.5, 0, 1.5, 3])
+        
+        # Raw score cache: recompute every N days or on a sharp VIX move
+        self.regime_recalc_days = 5
+        self.regime_recalc_vix_move = 1.0
+        self.raw_regime_score = None
+        self.last_regime_calc = None
+        self.last_regime_vix = None
+        
+    @staticmethod
+    def param_vector(params):
+        """Pack a regime parameter dict into a float vector in PARAM_FIELDS order."""
+        return np.array([params[field] for field in PARAM_FIELDS], dtype=float)
+    
+    @staticmethod
+    def threshold_cutoffs(low, mid_low, mid_high, high):
+        """
+        Sorted cutoffs for np.searchsorted(..., side='right') over 5 buckets:
+        x < low, x < mid_low, neutral, x > mid_high, x > high.
+        
+        The upper two are strict '>' tests, so they move up one ulp to keep
+        x == mid_high / x == high in the lower bucket.
+        """
+        return np.array([low, mid_low, np.nextafter(mid_high, np.inf), np.nextafter(high, np.inf)])
+    
     def calculate_regime_score(self):
         """
         Calculate regime score (0-100).
@@ -278,110 +418,78 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
         self.term_component = 0
         self.disp_component = 0
 
+        # Sector price window shared by the correlation and dispersion blocks:
+        # the last 30 prices per sector (fewer while the histories fill up)
+        window_len = min(self.sector_head, 30)
+        if window_len >= 20:
+            sector_window = self.sector_buf.take(np.arange(self.sector_head - window_len, self.sector_head),
+                                                 axis=1, mode='wrap')
+
         # 1. VIX Level (20% weight)
-        if self.vix and len(self.vix_history) > 20:
-            current_vix = self.securities[self.vix].price
-            avg_vix = np.mean(list(self.vix_history)[-60:]) if len(self.vix_history) >= 60 else current_vix
-
-            if avg_vix > 22:
-                self.vix_component = 4
-            elif avg_vix > 18:
-                self.vix_component = 2
-            elif avg_vix < 13:
-                self.vix_component = -4
-            elif avg_vix < 15:
-                self.vix_component = -2
+        if self.vix and self.vix_head > 20:
+            current_vix = self.prices[self.vix_col]
+            if self.vix_head >= 60:
+                avg_vix = np.mean(self.vix_buf.take(np.arange(self.vix_head - 60, self.vix_head), mode='wrap'))
+            else:
+                avg_vix = current_vix
 
+            self.vix_component = float(
+                self.vix_components[np.searchsorted(self.vix_thresholds, avg_vix, side='right')]
+            )
             score += self.vix_component
         
         # 2. Sector Correlation (25% weight)
-        if all(len(hist) >= 30 for hist in self.sector_history.values()):
-            correlations = []
-            sector_names = list(self.sector_etfs.keys())
-
-            for i in range(len(sector_names)):
-                for j in range(i+1, len(sector_names)):
-                    s1 = list(self.sector_history[sector_names[i]])[-30:]
-                    s2 = list(self.sector_history[sector_names[j]])[-30:]
-                    if len(s1) >= 30 and len(s2) >= 30:
-                        corr = np.corrcoef(s1, s2)[0, 1]
-                        if not np.isnan(corr):
-                            correlations.append(corr)
-
-            if correlations:
-                avg_corr = np.mean(correlations)
-
-                if avg_corr < 0.40:
-                    self.corr_component = 6.25
-                elif avg_corr < 0.50:
-                    self.corr_component = 3.75
-                elif avg_corr > 0.65:
-                    self.corr_component = -6.25
-                elif avg_corr > 0.55:
-                    self.corr_component = -3.75
-
+        if len(self.sector_buf) >= 2 and window_len >= 30:
+            # One corrcoef over the (n_sectors, 30) window, then its upper triangle
+            corr_matrix = np.corrcoef(sector_window)
+            # NaN pairs (flat price rows) drop out; all-NaN leaves avg_corr NaN
+            avg_corr = np.nanmean(corr_matrix[self.corr_iu])
+
+            if np.isfinite(avg_corr):
+                self.corr_component = float(
+                    self.corr_components[np.searchsorted(self.corr_thresholds, avg_corr, side='right')]
+                )
                 score += self.corr_component
         
         # 3. Rate Environment (25% weight)
         if self.tlt_sma.is_ready:
-            tlt_price = self.securities[self.tlt].price
+            tlt_price = self.prices[self.tlt_col]
             tlt_sma = self.tlt_sma.current.value
 
-            if tlt_price < tlt_sma * 0.95:
-                self.rate_component = 5
-            elif tlt_price < tlt_sma:
-                self.rate_component = 2.5
-            elif tlt_price > tlt_sma * 1.05:
-                self.rate_component = -5
-            elif tlt_price > tlt_sma:
-                self.rate_component = -2.5
-
+            self.rate_component = float(
+                self.rate_components[np.searchsorted(self.rate_thresholds, tlt_price / tlt_sma, side='right')]
+            )
             score += self.rate_component
         
         # 4. Volatility Term Structure (15% weight)
         if self.vxx and self.vix:
             try:
-                vxx_price = self.securities[self.vxx].price
-                vix_price = self.securities[self.vix].price
+                vxx_price = self.prices[self.vxx_col]
+                vix_price = self.prices[self.vix_col]
 
                 if vxx_price > 0 and vix_price > 0:
                     vxx_ratio = vxx_price / 20
                     term_structure = vxx_ratio / vix_price
 
-                    if term_structure > 1.15:
-                        self.term_component = 3
-                    elif term_structure > 1.05:
-                        self.term_component = 1.5
-                    elif term_structure < 0.85:
-                        self.term_component = -3
-                    elif term_structure < 0.95:
-                        self.term_component = -1.5
-
+                    self.term_component = float(
+                        self.term_components[np.searchsorted(self.term_thresholds, term_structure, side='right')]
+                    )
                     score += self.term_component
             except:
                 pass
         
         # 5. Market Dispersion (15% weight)
-        if all(len(hist) >= 20 for hist in self.sector_history.values()):
-            recent_returns = []
-            for sector_hist in self.sector_history.values():
-                prices = list(sector_hist)[-20:]
-                if len(prices) >= 20:
-                    ret = (prices[-1] - prices[-20]) / prices[-20]
-                    recent_returns.append(ret)
-
-            if len(recent_returns) >= 4:
-                dispersion = np.std(recent_returns)
-
-                if dispersion > 0.10:
-                    self.disp_component = 3
-                elif dispersion > 0.07:
-                    self.disp_component = 1.5
-                elif dispersion < 0.03:
-                    self.disp_component = -3
-                elif dispersion < 0.05:
-                    self.disp_component = -1.5
+        if window_len >= 20:
+            # 20-day return of every sector in one vectorized expression
+            past = sector_window[:, -20]
+            recent_returns = (sector_window[:, -1] - past) / past
+
+            if recent_returns.size >= 4:
+                dispersion = recent_returns.std()
 
+                self.disp_component = float(
+                    self.disp_components[np.searchsorted(self.disp_thresholds, dispersion, side='right')]
+                )
                 score += self.disp_component
         
         return max(0, min(100, score))
@@ -389,12 +497,25 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
     def update_regime(self):
         """Update regime with hysteresis to prevent whipsawing."""
         
-        new_score = self.calculate_regime_score()
+        # Reuse the cached raw score between recalculations (regime dynamics are weekly-ish)
+        current_vix = self.prices[self.vix_col] if self.vix else None
+        vix_moved = (current_vix is not None and self.last_regime_vix is not None
+                     and abs(current_vix - self.last_regime_vix) > self.regime_recalc_vix_move)
+        if (self.last_regime_calc is None or vix_moved
+                or (self.time - self.last_regime_calc).days >= self.regime_recalc_days):
+            self.raw_regime_score = self.calculate_regime_score()
+            self.last_regime_calc = self.time
+            self.last_regime_vix = current_vix
+        
+        new_score = self.raw_regime_score
+        if len(self.regime_history) == self.regime_history.maxlen:
+            self.regime_sum -= self.regime_history[0]
         self.regime_history.append(new_score)
+        self.regime_sum += new_score
         
         # Smooth with 10-day average
         if len(self.regime_history) >= 10:
-            self.regime_score = np.mean(list(self.regime_history)[-10:])
+            self.regime_score = self.regime_sum / len(self.regime_history)
         else:
             self.regime_score = new_score
         
@@ -426,37 +547,25 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
         """
         Get active pairs, parameters, and allocation based on regime.
         """
-        
-        if self.current_regime == "QT":
-            # High dispersion - use champions
-            pairs = self.qt_champion_pairs
-            params = self.qt_params
-            allocation = 0.70
-            
-        elif self.current_regime == "ZIRP":
-            # Low dispersion - use ZIRP pairs
-            pairs = self.zirp_pairs
-            params = self.zirp_params
-            allocation = 0.40
-            
-        else:  # TRANSITIONAL
-            # Use both with reduced sizing
-            pairs = self.qt_champion_pairs + self.zirp_pairs
-            params = self.transition_params
-            allocation = 0.50
-        
-        return pairs, params, allocation
+        return self.regime_configs[self.current_regime]
     
     def check_pairs_and_trade(self):
         """Main trading logic with regime awareness."""
         
+        # Prefetch every price once per bar
+        for col, symbol in enumerate(self.price_symbols):
+            self.prices[col] = self.securities[symbol].price
+        
         # Update historical data for regime detection
-        if self.vix and self.securities[self.vix].price > 0:
-            self.vix_history.append(self.securities[self.vix].price)
+        if self.vix and self.prices[self.vix_col] > 0:
+            self.vix_buf[self.vix_head % len(self.vix_buf)] = self.prices[self.vix_col]
+            self.vix_head += 1
         
-        for ticker, symbol in self.sector_etfs.items():
-            if self.securities[symbol].price > 0:
-                self.sector_history[ticker].append(self.securities[symbol].price)
+        # One column write per bar, only once every sector has a price
+        sector_prices = self.prices[self.sector_cols]
+        if sector_prices.size and (sector_prices > 0).all():
+            self.sector_buf[:, self.sector_head % self.sector_buf.shape[1]] = sector_prices
+            self.sector_head += 1
         
         # Update regime
         if not self.is_warming_up:
@@ -469,58 +578,31 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
         num_pairs = len(active_pairs)
         position_size_per_pair = regime_allocation / num_pairs if num_pairs > 0 else 0
         
-        # Process each pair
+        # Update spreads and Z-scores for all active pairs in one kernel call
+        pair_rows = self.regime_pair_rows[self.current_regime]
+        lookback = int(params[PARAM_FIELDS.index('lookback')])
+        z_scores, spreads = update_pair_zscores(
+            pair_rows,
+            self.prices[self.pair_long_cols[pair_rows]],
+            self.prices[self.pair_short_cols[pair_rows]],
+            self.spread_buf, self.spread_head, self.spread_sum, self.spread_sumsq,
+            self.lookbacks, self.lookback_col[lookback], 20
+        )
+        
+        # Mark pairs as active
         for pair_config in active_pairs:
-            pair_name = pair_config['name']
-            data = self.pair_data[pair_name]
-            
-            # Mark pair as active/inactive
-            data['active'] = True
-            
-            # Get prices
-            long_price = self.securities[data['long_symbol']].price
-            short_price = self.securities[data['short_symbol']].price
-            
-            if long_price <= 0 or short_price <= 0:
-                continue
-            
-            # Calculate spread
-            current_spread = self.calculate_spread(long_price, short_price)
-            if current_spread is None:
-                continue
-            
-            data['spread_history'].append(current_spread)
-            
-            # Calculate Z-score with appropriate lookback
-            lookback = min(params['lookback'], len(data['spread_history']))
-            recent_spreads = list(data['spread_history'])[-lookback:]
-            z_score = self.calculate_z_score_from_list(current_spread, recent_spreads)
-            self.z_score = z_score
-            
-            if z_score is None or self.is_warming_up:
-                continue
-            
-            # Store statistics
-            data['spread_mean'] = np.mean(recent_spreads)
-            data['spread_std'] = np.std(recent_spreads, ddof=1)
-            
-            # Trading logic
-            if data['position_open']:
-                self.check_exit_signals(
-                    pair_name, data, z_score, current_spread, params
-                )
-            else:
-                self.check_entry_signals(
-                    pair_name, data, z_score, current_spread, 
-                    params, position_size_per_pair
-                )
+            self.pair_data[pair_config['name']]['active'] = True
+        
+        if not self.is_warming_up:
+            self.trade_signals(active_pairs, pair_rows, z_scores, spreads, params, position_size_per_pair)
         
         # Mark inactive pairs
+        active_names = {p['name'] for p in active_pairs}
         for pair_name, data in self.pair_data.items():
-            if pair_name not in [p['name'] for p in active_pairs]:
+            if pair_name not in active_names:
                 data['active'] = False
                 # Close positions in inactive pairs
-                if data['position_open']:
+                if self.pos_open[self.pair_index[pair_name]]:
                     self.debug(f"Closing {pair_name} - no longer active in {self.current_regime} regime")
                     self.exit_pair(pair_name, data, 0, 0, 'REGIME_SWITCH', 0)
 
@@ -528,31 +610,44 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
         if not self.is_warming_up:
             self._plot_debug_indicators()
     
-    def calculate_spread(self, long_price, short_price):
-        """Calculate log price spread."""
-        if long_price <= 0 or short_price <= 0:
-            return None
-        return np.log(long_price) - np.log(short_price)
-    
-    def calculate_z_score_from_list(self, current_spread, spread_list):
-        """Calculate Z-score from spread list."""
-        if len(spread_list) < 20:
-            return None
-        
-        mean = np.mean(spread_list)
-        std = np.std(spread_list, ddof=1)
-        
-        if std == 0:
-            return None
-        
-        return (current_spread - mean) / std
-    
-    def check_entry_signals(self, pair_name, data, z_score, spread, params, position_size):
-        """Check for entry signals."""
-        
-        if abs(z_score) > params['z_entry']:
-            direction = 'short_spread' if z_score > 0 else 'long_spread'
-            self.enter_pair(pair_name, data, direction, z_score, spread, position_size)
+    def trade_signals(self, active_pairs, pair_rows, z_scores, spreads, params, position_size):
+        """Evaluate entry and exit rules for all active pairs as masks, then act on the hits."""
+        
+        valid = ~np.isnan(z_scores)
+        is_open = self.pos_open[pair_rows]
+        abs_z = np.abs(z_scores)
+        holding_days = self.time.toordinal() - self.entry_day[pair_rows]
+        
+        # Exit rules (later rules win: STOP_LOSS > TIMEOUT > MEAN_REVERSION)
+        z_entry, z_exit, stop_loss_z, _, max_holding_days = params
+        mean_reversion = abs_z < z_exit
+        timeout = holding_days >= max_holding_days
+        stop_loss = abs_z > stop_loss_z
+        exit_mask = valid & is_open & (mean_reversion | timeout | stop_loss)
+        entry_mask = valid & ~is_open & (abs_z > z_entry)
+        
+        # Debug plot state tracks the last pair evaluated
+        checked = np.flatnonzero(valid)
+        if checked.size:
+            self.z_score = z_scores[checked[-1]]
+        held = np.flatnonzero(valid & is_open)
+        if held.size:
+            self.holding_days = int(holding_days[held[-1]])
+        
+        for j in np.flatnonzero(exit_mask | entry_mask):
+            pair_name = active_pairs[j]['name']
+            data = self.pair_data[pair_name]
+            if exit_mask[j]:
+                if stop_loss[j]:
+                    exit_reason = 'STOP_LOSS'
+                elif timeout[j]:
+                    exit_reason = 'TIMEOUT'
+                else:
+                    exit_reason = 'MEAN_REVERSION'
+                self.exit_pair(pair_name, data, z_scores[j], spreads[j], exit_reason, int(holding_days[j]))
+            else:
+                direction = 'short_spread' if z_scores[j] > 0 else 'long_spread'
+                self.enter_pair(pair_name, data, direction, z_scores[j], spreads[j], position_size)
     
     def enter_pair(self, pair_name, data, direction, z_score, spread, position_size):
         """Enter a pairs trade."""
@@ -568,10 +663,11 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
             self.set_holdings(data['short_symbol'], leg_size)
             signal = 'SHORT SPREAD'
         
-        data['position_open'] = True
-        data['entry_date'] = self.time
-        data['entry_z_score'] = z_score
-        data['entry_spread'] = spread
+        row = self.pair_index[pair_name]
+        self.pos_open[row] = True
+        self.entry_day[row] = self.time.toordinal()
+        self.entry_z[row] = z_score
+        self.entry_spread[row] = spread
         
         self.total_trades += 1
         self.regime_trades[self.current_regime] += 1
@@ -579,35 +675,14 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
         self.debug(f"ENTRY - {pair_name} [{self.current_regime}] | {signal} | Z={z_score:.2f}")
         self.entry_signal = 1
     
-    def check_exit_signals(self, pair_name, data, z_score, spread, params):
-        """Check for exit signals."""
-        
-        exit_reason = None
-        
-        # Mean reversion
-        if abs(z_score) < params['z_exit']:
-            exit_reason = 'MEAN_REVERSION'
-        
-        # Timeout
-        holding_days = (self.time - data['entry_date']).days
-        self.holding_days = holding_days
-        if holding_days >= params['max_holding_days']:
-            exit_reason = 'TIMEOUT'
-        
-        # Stop loss
-        if abs(z_score) > params['stop_loss_z']:
-            exit_reason = 'STOP_LOSS'
-        
-        if exit_reason:
-            self.exit_pair(pair_name, data, z_score, spread, exit_reason, holding_days)
-    
     def exit_pair(self, pair_name, data, z_score, spread, exit_reason, holding_days):
         """Exit a pairs trade."""
         
         self.liquidate(data['long_symbol'])
         self.liquidate(data['short_symbol'])
         
-        entry_z = data['entry_z_score']
+        row = self.pair_index[pair_name]
+        entry_z = self.entry_z[row]
         z_change = abs(z_score) - abs(entry_z) if entry_z else 0
         
         is_winner = False
@@ -619,10 +694,10 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
                 is_winner = True
                 self.winning_trades += 1
         
-        data['position_open'] = False
-        data['entry_date'] = None
-        data['entry_z_score'] = None
-        data['entry_spread'] = None
+        self.pos_open[row] = False
+        self.entry_day[row] = -1
+        self.entry_z[row] = 0.0
+        self.entry_spread[row] = 0.0
         
         win_rate = (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
         
@@ -697,37 +772,53 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
         self.term_component = 0
         self.disp_component = 0
 
+        # Plot sampling state: last value per (chart, series), last month of threshold lines
+        self.last_plotted = {}
+        self.last_plot_month = None
+
+    def _plot_on_change(self, chart, series, value):
+        """Plot a point only when the series value differs from the last one plotted."""
+        key = (chart, series)
+        if self.last_plotted.get(key) != value:
+            self.last_plotted[key] = value
+            self.plot(chart, series, value)
+
     def _plot_debug_indicators(self):
-        """Plot regime indicators for debugging."""
+        """Plot regime indicators for debugging (sampled: on change, thresholds monthly)."""
+        # Constant threshold lines only need one point per month
+        month = (self.time.year, self.time.month)
+        if month != self.last_plot_month:
+            self.last_plot_month = month
+            self.plot("Holding days", "exit limit", 10)
+
+            # self.plot("Z Score", "Score", self.z_score)
+            self.plot("Z Score", "ZIRP Entry", 1.5)
+            self.plot("Z Score", "Entry", 1.5)
+            self.plot("Z Score", "ZIRP Exit", -0.75)
+            self.plot("Z Score", "Exit", -1.0)
+            self.plot("Z Score", "ZIRP Stop Loss", -3.75)
+            self.plot("Z Score", "Stop Loss", -4.0)
+
+            self.plot("Regime Score", "QT Threshold (65)", 65)
+            self.plot("Regime Score", "Transition Threshold (55)", 55)
+            self.plot("Regime Score", "Transition Threshold (45)", 45)
+            self.plot("Regime Score", "ZIRP Threshold (35)", 35)
+
         # Plot holding days
-        self.plot("Holding days", "days", self.holding_days)
-        self.plot("Holding days", "exit limit", 10)
+        self._plot_on_change("Holding days", "days", self.holding_days)
 
         # Plot Entry & Exit Signals
-        self.plot("Entry & Exit Signals", "Entry signal", self.entry_signal)
-
-        # Plot Z Score
-        # self.plot("Z Score", "Score", self.z_score)
-        self.plot("Z Score", "ZIRP Entry", 1.5)
-        self.plot("Z Score", "Entry", 1.5)
-        self.plot("Z Score", "ZIRP Exit", -0.75)
-        self.plot("Z Score", "Exit", -1.0)
-        self.plot("Z Score", "ZIRP Stop Loss", -3.75)
-        self.plot("Z Score", "Stop Loss", -4.0)
+        self._plot_on_change("Entry & Exit Signals", "Entry signal", self.entry_signal)
 
         # Plot regime score
-        self.plot("Regime Score", "Score", self.regime_score)
-        self.plot("Regime Score", "QT Threshold (65)", 65)
-        self.plot("Regime Score", "Transition Threshold (55)", 55)
-        self.plot("Regime Score", "Transition Threshold (45)", 45)
-        self.plot("Regime Score", "ZIRP Threshold (35)", 35)
+        self._plot_on_change("Regime Score", "Score", self.regime_score)
 
         # Plot individual indicator components
-        self.plot("Score Components", "VIX Component", self.vix_component)
-        self.plot("Score Components", "Correlation Component", self.corr_component)
-        self.plot("Score Components", "Rate Component", self.rate_component)
-        self.plot("Score Components", "Term Struct Component", self.term_component)
-        self.plot("Score Components", "Dispersion Component", self.disp_component)
+        self._plot_on_change("Score Components", "VIX Component", self.vix_component)
+        self._plot_on_change("Score Components", "Correlation Component", self.corr_component)
+        self._plot_on_change("Score Components", "Rate Component", self.rate_component)
+        self._plot_on_change("Score Components", "Term Struct Component", self.term_component)
+        self._plot_on_change("Score Components", "Dispersion Component", self.disp_component)
 
         # Plot pair activation status (1 = active, 0 = inactive)
         all_pairs = self.qt_champion_pairs + self.zirp_pairs
@@ -735,4 +826,4 @@ class RegimeDiversifiedStatArb(QCAlgorithm):
             pair_name = pair_config['name']
             data = self.pair_data[pair_name]
             status = 1 if data.get('active', False) else 0
-            self.plot("Active Pairs", pair_name, status)
\ No newline at end of file
+            self._plot_on_change("Active Pairs", pair_name, status)
@@ -0,0 +1 @@
+"""Project CLI scripts (also importable as a package, e.g. python -m SCRIPTS.backtesting_analysis)."""
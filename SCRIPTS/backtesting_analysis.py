@@ -7,96 +7,314 @@ backtest results and detecting overfitting.
 
 Usage:
     python SCRIPTS/backtesting_analysis.py --help
+    python -m SCRIPTS.backtesting_analysis --help
 
 Note: All help content loaded from HELP/backtesting_analysis.json
 """
 
-import argparse
+import functools
+import os
+import shutil
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
-# Add SCRIPTS to path for imports
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
+# No sys.path edits: run as a script, SCRIPTS/ is already sys.path[0];
+# run as `python -m SCRIPTS.backtesting_analysis`, help_loader is a sibling module
+HELP_FILE = Path(__file__).parent.parent / "HELP" / "backtesting_analysis.json"
 
-from help_loader import load_help, format_help
+# Priority markers for --list-sections, indexed by section priority (schema: 1-3;
+# validate_help_file does not enforce it, so out-of-range values fall back to "★" * p)
+_STARS = tuple("★" * i for i in range(6))
 
-def main():
-    # Load help from JSON
+# Stamped into the HELP/*.txt sidecars; bump whenever the rendered text changes
+RENDER_VERSION = 2
+
+VERSION = '2.0.0'
+
+# Long option -> metavar (None for flags); -h is the only short option
+OPTIONS = {
+    '--help': None,
+    '--version': None,
+    '--section': 'SECTION',
+    '--search': 'SEARCH',
+    '--list-sections': None,
+}
+
+USAGE_PARTS = ('[-h]', '[--version]', '[--section SECTION]', '[--search SEARCH]', '[--list-sections]')
+
+OPTIONS_HELP = """
+Backtesting Analysis Reference Documentation
+
+options:
+  -h, --help         show this help message and exit
+  --version          show program's version number and exit
+  --section SECTION  Show specific section by ID
+  --search SEARCH    Search help content
+  --list-sections    List all available sections
+"""
+
+
+def _help_loader():
+    """Import help_loader lazily, package-relative when run with -m."""
+    if __package__:
+        from . import help_loader
+    else:
+        import help_loader
+    return help_loader
+
+
+def _code_stamp():
+    """Newest mtime_ns of the rendering code: this module and help_loader.
+
+    Inside the zipapp both are archive members, so the archive's own mtime
+    (which changes on every rebuild) stands in for them.
+    """
+    here = Path(__file__)
+    stamp = 0
+    for path in (here, here.with_name("help_loader.py")):
+        for candidate in (path, path.parent):
+            try:
+                stamp = max(stamp, candidate.stat().st_mtime_ns)
+                break
+            except OSError:
+                continue
+    return stamp
+
+
+def _cached_text(help_path, suffix, render):
+    """Return render(), cached in a <name><suffix> sidecar next to the help JSON.
+
+    The sidecar's first line stamps RENDER_VERSION, the rendering code
+    (_code_stamp, which covers help_loader.format_help) and the JSON's mtime
+    and size; on a mismatch the text is re-rendered and the sidecar
+    rewritten. Errors are not cached.
+    """
     try:
-        help_data = load_help("backtesting_analysis")
-        epilog = format_help(help_data)
+        stat = help_path.stat()
+    except OSError:
+        stat = None
+    header = (f"# v={RENDER_VERSION} code={_code_stamp()} mtime={stat.st_mtime_ns} size={stat.st_size}\n"
+              if stat else None)
+    cache_path = help_path.with_suffix(suffix)
+
+    if header:
+        try:
+            cached = cache_path.read_text(encoding='utf-8')
+            if cached.startswith(header):
+                return cached[len(header):]
+        except OSError:
+            pass
+
+    text = render()
+
+    # Best effort, written atomically: a read-only HELP/ just means no cache
+    if header:
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(header + text, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    return text
+
+
+def _render_epilog():
+    # Lazy load help_loader (Progressive Disclosure - only load when needed)
+    help_loader = _help_loader()
+
+    return help_loader.format_help(help_loader.load_help("backtesting_analysis"))
+
+
+@functools.lru_cache(maxsize=1)
+def load_epilog():
+    """Full reference text, cached in a .help.txt sidecar (and once per process)."""
+    try:
+        return _cached_text(HELP_FILE, ".help.txt", _render_epilog)
     except Exception as e:
-        epilog = f"Error loading help: {e}\nCheck HELP/backtesting_analysis.json"
-
-    parser = argparse.ArgumentParser(
-        description="Backtesting Analysis Reference Documentation",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=epilog
-    )
-
-    parser.add_argument('--version', action='version', version='2.0.0')
-    parser.add_argument('--section', help='Show specific section by ID')
-    parser.add_argument('--search', help='Search help content')
-    parser.add_argument('--list-sections', action='store_true',
-                       help='List all available sections')
-
-    args = parser.parse_args()
-
-    # Section-specific display
-    if args.list_sections:
-        print("Available sections:")
-        for section in help_data.get('sections', []):
-            priority_marker = "★" * section.get('priority', 3)
-            print(f"  {priority_marker} {section['id']}: {section['title']}")
-            if section.get('tags'):
-                print(f"     Tags: {', '.join(section['tags'])}")
-        sys.exit(0)
-
-    if args.section:
-        from help_loader import get_section
-        section = get_section(help_data, args.section)
-        if section:
-            print(f"\n{'=' * 80}")
-            print(f"{section['title'].upper()}")
-            print('=' * 80)
-            print()
-            print(section['content'])
-            print()
-            if section.get('tags'):
-                print(f"Tags: {', '.join(section['tags'])}")
-        else:
-            print(f"❌ Section not found: {args.section}")
-            print("\nUse --list-sections to see available sections")
-            sys.exit(1)
-        sys.exit(0)
-
-    if args.search:
-        from help_loader import search_help
-        results = search_help(args.search)
-
-        # Filter to this tool only
-        results = [r for r in results if r.get('tool') == 'backtesting_analysis']
-
-        if results:
-            print(f"\n{'=' * 80}")
-            print(f"Search results for '{args.search}' ({len(results)} found)")
-            print('=' * 80)
-            for result in results:
-                if result.get('section_title'):
-                    print(f"\n### {result['section_title']}")
-                    print(f"Section ID: {result['section_id']}")
-                    print(f"Tags: {', '.join(result.get('tags', []))}")
-                elif result.get('question'):
-                    print(f"\n### FAQ: {result['question']}")
-                    print(f"A: {result['answer']}")
-            print()
+        return f"Error loading help: {e}\nCheck HELP/backtesting_analysis.json"
+
+
+def load_tool_help():
+    """Load HELP/backtesting_analysis.json, exiting with a message if it is unusable."""
+    try:
+        return _help_loader().load_help("backtesting_analysis")
+    except Exception as e:
+        print(f"❌ Error loading help: {e}")
+        print("Check HELP/backtesting_analysis.json")
+        sys.exit(1)
+
+
+def _render_section_list():
+    lines = ["Available sections:"]
+    for section in load_tool_help().get('sections', []):
+        priority = section.get('priority', 3)
+        priority_marker = _STARS[priority] if 0 <= priority < len(_STARS) else "★" * max(priority, 0)
+        lines.append(f"  {priority_marker} {section['id']}: {section['title']}")
+        if section['_tags_str']:
+            lines.append(f"     Tags: {section['_tags_str']}")
+    return "\n".join(lines) + "\n"
+
+
+def _list_sections_cached(help_path):
+    """Return the --list-sections text, cached in a <name>.sections.txt sidecar."""
+    return _cached_text(help_path, ".sections.txt", _render_section_list)
+
+
+def print_help():
+    """Write usage, the option table and the full reference in one call."""
+    sys.stdout.write(usage() + OPTIONS_HELP + "\n" + load_epilog() + "\n")
+
+
+def list_sections(args):
+    """Handle --list-sections."""
+    sys.stdout.write(_list_sections_cached(HELP_FILE))
+    sys.exit(0)
+
+
+def show_section(args):
+    """Handle --section ID."""
+    section = _help_loader().get_section(load_tool_help(), args.section)
+    if section:
+        # One write for the whole section instead of a print() per line
+        out = f"\n{'=' * 80}\n{section['title'].upper()}\n{'=' * 80}\n\n{section['content']}\n\n"
+        if section['_tags_str']:
+            out += f"Tags: {section['_tags_str']}\n"
+        sys.stdout.write(out)
+    else:
+        print(f"❌ Section not found: {args.section}")
+        print("\nUse --list-sections to see available sections")
+        sys.exit(1)
+    sys.exit(0)
+
+
+def search(args):
+    """Handle --search QUERY."""
+    results = _help_loader().search_help(args.search, tool='backtesting_analysis')
+
+    if results:
+        out = [f"\n{'=' * 80}\nSearch results for '{args.search}' ({len(results)} found)\n{'=' * 80}\n"]
+        for result in results:
+            if result.get('section_title'):
+                out.append(f"\n### {result['section_title']}\n"
+                           f"Section ID: {result['section_id']}\n"
+                           f"Tags: {', '.join(result.get('tags', []))}\n")
+            elif result.get('question'):
+                out.append(f"\n### FAQ: {result['question']}\nA: {result['answer']}\n")
+        out.append("\n")
+        sys.stdout.write("".join(out))
+    else:
+        print(f"\n❌ No results found for '{args.search}'")
+        print("Try searching with different keywords or use --help to see all content")
+    sys.exit(0)
+
+
+# Option -> handler, in precedence order; each handler imports only what it uses
+HANDLERS = (
+    ('list_sections', list_sections),
+    ('section', show_section),
+    ('search', search),
+)
+
+
+def usage():
+    """Usage line(s), wrapped to the terminal width the way argparse does."""
+    prog = os.path.basename(sys.argv[0])
+    width = shutil.get_terminal_size().columns - 2
+    line = f"usage: {prog}"
+    indent = " " * (len(line) + 1)
+    lines = []
+    for part in USAGE_PARTS:
+        if len(line) + 1 + len(part) > width and line.strip():
+            lines.append(line)
+            line = indent + part
         else:
-            print(f"\n❌ No results found for '{args.search}'")
-            print("Try searching with different keywords or use --help to see all content")
-        sys.exit(0)
+            line += " " + part
+    lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def fail(message):
+    """Print usage plus an error and exit 2 (argparse's convention)."""
+    sys.stderr.write(usage())
+    sys.stderr.write(f"{os.path.basename(sys.argv[0])}: error: {message}\n")
+    sys.exit(2)
+
+
+def parse_args(argv):
+    """Minimal parser for the five options above.
+
+    Accepts --opt VALUE, --opt=VALUE and unambiguous prefixes (--sec, --list),
+    like argparse. -h/--help prints the full reference and exits.
+    """
+    args = SimpleNamespace(section=None, search=None, list_sections=False)
+    unrecognized = []
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if arg == '-h':
+            arg = '--help'
+        if not arg.startswith('--') or arg == '--':
+            unrecognized.append(arg)
+            continue
+
+        name, has_value, value = arg.partition('=')
+        matches = [name] if name in OPTIONS else [opt for opt in OPTIONS if opt.startswith(name)]
+        if not matches:
+            unrecognized.append(arg)
+            continue
+        if len(matches) > 1:
+            fail(f"ambiguous option: {name} could match {', '.join(matches)}")
+        option = matches[0]
+
+        if OPTIONS[option] is None:
+            if has_value:
+                fail(f"argument {option}: ignored explicit argument '{value}'")
+            if option == '--help':
+                print_help()
+                sys.exit(0)
+            if option == '--version':
+                print(VERSION)
+                sys.exit(0)
+            args.list_sections = True
+            continue
+
+        if not has_value:
+            if i >= len(argv) or argv[i].startswith('-'):
+                fail(f"argument {option}: expected one argument")
+            value = argv[i]
+            i += 1
+        setattr(args, option[2:], value)
+
+    if unrecognized:
+        fail(f"unrecognized arguments: {' '.join(unrecognized)}")
+    return args
+
+
+def run(argv=None):
+    """Run the CLI on argv (default: sys.argv[1:])."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Bare invocation shows the full reference, skipping the parser entirely
+    if not argv:
+        print_help()
+        return
+
+    args = parse_args(argv)
+
+    for option, handler in HANDLERS:
+        if getattr(args, option):
+            handler(args)
+
+
+def main():
+    run()
 
-    # If no args, argparse will show --help automatically
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Build backtesting_analysis as a single-file zipapp
+
+Packs backtesting_analysis.py and help_loader.py as precompiled .pyc files
+(sourceless), so each cold run loads bytecode via zipimport instead of
+tokenizing and compiling the sources.
+
+Usage:
+    python SCRIPTS/build_zipapp.py                 # -> ./bt_analysis.pyz
+
+    python bt_analysis.pyz --list-sections
+
+Notes:
+- The .pyc files only load on the Python version that built them; rebuild
+  after upgrading the interpreter.
+- Help files are read from the HELP/ directory beside the archive, so keep the
+  .pyz in the repository root (the default output location).
+"""
+
+import argparse
+import py_compile
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+MODULES = ('backtesting_analysis', 'help_loader')
+MAIN = "import backtesting_analysis\nbacktesting_analysis.main()\n"
+
+
+def build(output: Path) -> Path:
+    """Compile MODULES into a staging dir and zip them into output."""
+    with tempfile.TemporaryDirectory() as staging:
+        staging = Path(staging)
+        for module in MODULES:
+            # Legacy (next-to-source) .pyc layout is what sourceless imports need
+            py_compile.compile(str(SCRIPT_DIR / f"{module}.py"),
+                               cfile=str(staging / f"{module}.pyc"),
+                               doraise=True, optimize=0)
+        (staging / "__main__.py").write_text(MAIN)
+
+        zipapp.create_archive(staging, target=output,
+                              interpreter="/usr/bin/env python3", compressed=True)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the backtesting_analysis zipapp")
+    parser.add_argument('-o', '--output', default=str(SCRIPT_DIR.parent / 'bt_analysis.pyz'),
+                        help='Output archive (default: <repo>/bt_analysis.pyz)')
+    args = parser.parse_args()
+
+    output = build(Path(args.output))
+    print(f"✅ Built {output} (Python {sys.version_info.major}.{sys.version_info.minor} bytecode)")
+
+
+if __name__ == "__main__":
+    main()
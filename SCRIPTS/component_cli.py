@@ -7,6 +7,7 @@ Usage:
     component show COMPONENT            # Show component code
     component explain COMPONENT         # Show integration guide
     component search KEYWORD            # Search components by keyword
+    component reindex                   # Rebuild the component index
 
 Progressive Disclosure Pattern (Beyond MCP):
 - Browse components without reading all source files
@@ -14,115 +15,338 @@ Progressive Disclosure Pattern (Beyond MCP):
 - CLI works for humans, teams, AND agents (trifecta)
 """
 
-import click
+import ast
+import codecs
+import functools
+import os
+import pickle
+import re
+import shutil
 import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, List, Optional
 
 # Absolute path resolution (Beyond MCP pattern)
 SCRIPT_DIR = Path(__file__).resolve().parent
 COMPONENT_DIR = SCRIPT_DIR / "strategy_components"
+INDEX_FILE = COMPONENT_DIR / ".index.pkl"
 
+# Hot paths (freshness stats, index scans) join plain strings instead of Path objects
+_COMPONENT_DIR_STR = str(COMPONENT_DIR)
 
+# Bump when the layout of .index.pkl (or the docstring parsing) changes
+INDEX_VERSION = 5
+
+# Leading comments/blank lines, then a (raw) triple-quoted string ending its line
+_DOC_RE = re.compile(rb'\A(?:[ \t]*(?:#[^\n]*)?\r?\n)*([rRuU]?)("""|\'\'\')(.*?)\2[ \t]*(?:#[^\n]*)?(?:\r?\n|\Z)',
+                     re.DOTALL)
+_RAW_PREFIXES = (b'r', b'R')
+
+# Names starting with these are private/hidden (not categories or components)
+_HIDDEN_PREFIXES = ('_', '.')
+
+RULE = "=" * 60
+
+# Docstrings sit at the top: read this much first, doubling up to the limit
+_HEAD_CHUNK = 4096
+_HEAD_LIMIT = 64 * 1024
+
+
+@functools.lru_cache(maxsize=1)
 def get_categories() -> List[str]:
-    """Get list of component categories."""
-    categories = []
-    for item in COMPONENT_DIR.iterdir():
-        if item.is_dir() and not item.name.startswith('_'):
-            categories.append(item.name)
-    return sorted(categories)
+    """Get list of component categories (scanned once per process)."""
+    # DirEntry answers is_dir() from the directory listing itself (no stat per entry)
+    with os.scandir(_COMPONENT_DIR_STR) as entries:
+        return sorted(e.name for e in entries if e.is_dir() and not e.name.startswith(_HIDDEN_PREFIXES))
+
+
+def _invalidate():
+    """Drop cached directory scans (for tests / long-running callers)."""
+    get_categories.cache_clear()
+    _load_index_data.cache_clear()
+    _scan_library.cache_clear()
+
+
+def _jobs() -> int:
+    """Reader threads for index scans: $COMPONENT_CLI_JOBS, else min(32, 4 * CPUs)."""
+    try:
+        return max(1, int(os.environ['COMPONENT_CLI_JOBS']))
+    except (KeyError, ValueError):
+        return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _read_component(path: str) -> Dict:
+    """Index record for one component file: mtime, docstring and its lowercased copy.
+
+    search tests keywords against 'docstring_lower', so the case folding is
+    paid once per file change instead of once per file on every search.
+    """
+    with open(path, 'rb') as f:
+        mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        docstring = _read_docstring(f)
+    return {'mtime_ns': mtime_ns, 'docstring': docstring, 'docstring_lower': docstring.lower()}
+
+
+def _scan_categories(categories: List[str]) -> Dict[str, Dict]:
+    """Build the index entries (dir mtime + per-component records) for categories.
+
+    Directories are listed serially; the file reads, which dominate on a cold
+    or networked filesystem, go through a thread pool (open/read release the GIL).
+    """
+    listings = []
+    for category in categories:
+        cat_path = os.path.join(_COMPONENT_DIR_STR, category)
+        # Stat before reading so a concurrent edit leaves the entry stale, not wrong
+        mtime_ns = os.stat(cat_path).st_mtime_ns
+        with os.scandir(cat_path) as entries:
+            files = sorted(e.name for e in entries
+                           if e.name.endswith('.py') and not e.name.startswith(_HIDDEN_PREFIXES)
+                           and e.is_file())
+        listings.append((category, mtime_ns, files))
+
+    paths = [os.path.join(_COMPONENT_DIR_STR, category, file_name)
+             for category, _, files in listings for file_name in files]
+    jobs = min(_jobs(), len(paths))
+    if jobs > 1:
+        from concurrent.futures import ThreadPoolExecutor  # only cold scans pay for it
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            records = iter(pool.map(_read_component, paths))
+    else:
+        records = map(_read_component, paths)
+
+    scanned = {}
+    for category, mtime_ns, files in listings:
+        scanned[category] = {'mtime_ns': mtime_ns,
+                             'components': {file_name[:-3]: next(records) for file_name in files}}
+    return scanned
+
+
+def _is_fresh(category: str, entry: Dict) -> bool:
+    """True if neither the category dir nor any of its components changed."""
+    cat_path = os.path.join(_COMPONENT_DIR_STR, category)
+    try:
+        if os.stat(cat_path).st_mtime_ns != entry['mtime_ns']:
+            return False
+        for name, component in entry['components'].items():
+            if os.stat(os.path.join(cat_path, name + '.py')).st_mtime_ns != component['mtime_ns']:
+                return False
+    except OSError:
+        return False
+    return True
+
+
+def _build_name_trie(index: Dict) -> Dict:
+    """Suffix trie over lowercased component names, for substring name search.
+
+    Every suffix of every name is a path of single-character keys from the
+    root; the '' key of the node where a suffix ends lists its [category, name].
+    """
+    root = {}
+    for category, entry in index.items():
+        for name in entry['components']:
+            lowered = name.lower()
+            for start in range(len(lowered)):
+                node = root
+                for ch in lowered[start:]:
+                    node = node.setdefault(ch, {})
+                node.setdefault('', []).append([category, name])
+    return root
+
+
+def _trie_matches(trie: Dict, keyword_lower: str) -> set:
+    """(category, name) pairs whose lowercased name contains keyword_lower."""
+    node = trie
+    for ch in keyword_lower:
+        node = node.get(ch)
+        if node is None:
+            return set()
+    
+    found = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for key, child in node.items():
+            if key:
+                stack.append(child)
+            else:
+                found.update((category, name) for category, name in child)
+    return found
+
+
+def _index_data(index: Dict[str, Dict]) -> Dict:
+    """Full .index.pkl payload for a per-category index."""
+    return {'version': INDEX_VERSION, 'categories': index, 'name_trie': _build_name_trie(index)}
+
+
+def _write_index(data: Dict) -> bool:
+    """Atomically rewrite INDEX_FILE (best effort: a read-only tree means no index)."""
+    tmp_file = INDEX_FILE.with_name(f"{INDEX_FILE.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, INDEX_FILE)
+    except OSError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _load_index_data() -> Dict:
+    """Load strategy_components/.index.pkl, rescanning only stale categories.
+
+    Returns {'version', 'categories', 'name_trie'} where 'categories' is
+    {category: {'mtime_ns', 'components': {name: {'mtime_ns', 'docstring', 'docstring_lower'}}}}.
+    A category is rescanned when its directory mtime (files added, removed or
+    renamed) or any of its components' mtimes differ from the stored values;
+    the name trie is rebuilt whenever a rescan changed anything.
+    """
+    try:
+        with open(INDEX_FILE, 'rb') as f:
+            data = pickle.load(f)
+        if data.get('version') != INDEX_VERSION:
+            data = {}
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError,
+            OverflowError, ImportError, MemoryError):
+        data = {}
+    cached = data.get('categories', {})
+
+    categories = get_categories()
+    stale = [category for category in categories
+             if not isinstance(cached.get(category), dict) or not _is_fresh(category, cached[category])]
+    scanned = _scan_categories(stale) if stale else {}
+    index = {category: scanned.get(category) or cached[category] for category in categories}
+
+    if index != cached or 'name_trie' not in data:
+        data = _index_data(index)
+        _write_index(data)
+    return data
+
+
+def _load_index() -> Dict[str, Dict]:
+    """Per-category component index (see _load_index_data)."""
+    return _load_index_data()['categories']
 
 
 def get_components(category: str = None) -> Dict[str, List[str]]:
     """Get components, optionally filtered by category."""
     components = {}
+    index = _load_index()
     
-    categories = [category] if category else get_categories()
+    categories = [category] if category else index
     
     for cat in categories:
-        cat_path = COMPONENT_DIR / cat
-        if not cat_path.exists():
-            continue
-        
-        component_files = []
-        for file in cat_path.iterdir():
-            if file.suffix == '.py' and not file.name.startswith('_'):
-                component_files.append(file.stem)
-        
-        if component_files:
-            components[cat] = sorted(component_files)
+        if cat in index and index[cat]['components']:
+            components[cat] = sorted(index[cat]['components'])
     
     return components
 
 
+@functools.lru_cache(maxsize=1)
+def _scan_library() -> Dict[str, str]:
+    """{name: category} for the whole library, from the one index walk.
+
+    Names are unique in practice; on a clash the first category (sorted) wins.
+    Doubles as the hit/miss cache for find_component_file.
+    """
+    library = {}
+    for category, entry in _load_index().items():
+        for name in entry['components']:
+            library.setdefault(name, category)
+    return library
+
+
 def find_component_file(component_name: str) -> Path:
     """Find component file by name (searches all categories)."""
-    # Try with underscores (add_rsi)
-    for category in get_categories():
-        file_path = COMPONENT_DIR / category / f"{component_name}.py"
-        if file_path.exists():
-            return file_path
-    
-    # Try with hyphens converted to underscores (add-rsi -> add_rsi)
-    component_name_underscore = component_name.replace('-', '_')
-    for category in get_categories():
-        file_path = COMPONENT_DIR / category / f"{component_name_underscore}.py"
-        if file_path.exists():
-            return file_path
-    
+    # Exact name first (add_rsi), then hyphens converted (add-rsi -> add_rsi)
+    library = _scan_library()
+    for name in (component_name, component_name.replace('-', '_')):
+        category = library.get(name)
+        if category:
+            return Path(os.path.join(_COMPONENT_DIR_STR, category, name + '.py'))
     return None
 
 
+def get_docstring(file_path: Path) -> str:
+    """Indexed module docstring of a component returned by find_component_file."""
+    return _load_index()[file_path.parent.name]['components'][file_path.stem]['docstring']
+
+
+# Docstrings are read from the source files, never via import + __doc__:
+# under python -OO (PYTHONOPTIMIZE=2) __doc__ is None, which would leave the
+# index full of empty docstrings and break explain/search. Reading source also
+# avoids executing component modules (and importing their dependencies).
 def extract_docstring(file_path: Path) -> str:
     """Extract module docstring from Python file."""
-    with open(file_path) as f:
-        lines = f.readlines()
-    
-    # Find docstring
-    in_docstring = False
-    docstring_lines = []
-    quote_type = None
-    
-    for line in lines:
-        stripped = line.strip()
-        
-        # Start of docstring
-        if not in_docstring and (stripped.startswith('"""') or stripped.startswith("'''")):
-            in_docstring = True
-            quote_type = '"""' if stripped.startswith('"""') else "'''"
-            
-            # Single-line docstring
-            if stripped.endswith(quote_type) and len(stripped) > 6:
-                return stripped[3:-3]
-            
-            # Multi-line docstring start
-            docstring_lines.append(stripped[3:])
-            continue
-        
-        # Inside docstring
-        if in_docstring:
-            # End of docstring
-            if stripped.endswith(quote_type):
-                docstring_lines.append(stripped[:-3])
-                break
-            else:
-                docstring_lines.append(line.rstrip())
-    
-    return '\n'.join(docstring_lines)
+    with open(file_path, 'rb') as f:
+        return _read_docstring(f)
 
 
-@click.group()
-def cli():
-    """Strategy component library CLI.
-    
-    Browse and integrate reusable strategy components with progressive disclosure.
+def _read_docstring(f) -> str:
+    """Extract module docstring from a binary file, reading only its head when possible.
+
+    Chunks are read until the fast-path regex matches with more source after
+    it (or at EOF). Past _HEAD_LIMIT, or when the regex does not apply, the
+    rest of the file is read and parsed in full.
+    """
+    source = b''
+    size = _HEAD_CHUNK
+    while True:
+        chunk = f.read(size)
+        source += chunk
+        eof = len(chunk) < size
+        match = _DOC_RE.match(source)
+        if match and (eof or match.end() < len(source)):
+            text = _fast_docstring(match)
+            if text is not None:
+                return _clean_docstring(text)
+            break
+        if eof or len(source) >= _HEAD_LIMIT:
+            break
+        size = len(source)
+
+    if not eof:
+        source += f.read()
+    return _extract_docstring_from_source(source)
+
+
+def _fast_docstring(match) -> Optional[str]:
+    """Docstring text from a _DOC_RE match, or None if it needs real unescaping."""
+    if match.group(1) in _RAW_PREFIXES or b'\\' not in match.group(3):
+        return match.group(3).decode('utf-8', errors='replace')
+    return None
+
+
+def _extract_docstring_from_source(source: bytes) -> str:
+    """Extract module docstring from already-loaded Python source.
+
+    The regex covers the usual layout (optional comments, then a plain or raw
+    triple-quoted string) in one pass; anything else (escapes, string
+    concatenation, no docstring) is left to ast, which is exact.
     """
-    pass
+    match = _DOC_RE.match(source)
+    text = _fast_docstring(match) if match else None
+    if text is None:
+        try:
+            text = ast.get_docstring(ast.parse(source), clean=False)
+        except (SyntaxError, ValueError):
+            text = None
+    return _clean_docstring(text) if text else ''
 
 
-@cli.command()
-@click.argument('category', required=False)
-def list(category: str):
+def _clean_docstring(text: str) -> str:
+    """inspect.cleandoc (without importing inspect), plus trailing whitespace stripped per line."""
+    lines = text.expandtabs().split('\n')
+    margin = min((len(line) - len(line.lstrip()) for line in lines[1:] if line.strip()),
+                 default=0)
+    lines = [lines[0].strip()] + [line[margin:].rstrip() for line in lines[1:]]
+    while lines and not lines[0]:
+        lines.pop(0)
+    while lines and not lines[-1]:
+        lines.pop()
+    return '\n'.join(lines)
+
+
+def list_components(category: str = None):
     """List components by category.
     
     Examples:
@@ -134,26 +358,28 @@ def list(category: str):
     
     if not components:
         if category:
-            click.echo(f"❌ No components found in category: {category}")
+            echo(f"❌ No components found in category: {category}")
         else:
-            click.echo("❌ No components found")
+            echo("❌ No components found")
         sys.exit(1)
     
-    click.echo("📦 Strategy Component Library")
-    click.echo("=" * 60)
+    # Build the whole listing, then write it once
+    out = []
+    emit = out.append
+    emit("📦 Strategy Component Library")
+    emit(RULE)
     
     for cat, comps in components.items():
-        click.echo(f"\n📁 {cat}/")
+        emit(f"\n📁 {cat}/")
         for comp in comps:
-            click.echo(f"   - {comp}")
+            emit(f"   - {comp}")
     
-    click.echo(f"\n💡 Use 'component show COMPONENT' to view code")
-    click.echo(f"💡 Use 'component explain COMPONENT' for integration guide")
+    emit(f"\n💡 Use 'component show COMPONENT' to view code")
+    emit(f"💡 Use 'component explain COMPONENT' for integration guide")
+    echo("\n".join(out))
 
 
-@cli.command()
-@click.argument('component_name')
-def show(component_name: str):
+def show_component(component_name: str):
     """Show component source code.
     
     Examples:
@@ -164,24 +390,24 @@ def show(component_name: str):
     file_path = find_component_file(component_name)
     
     if not file_path:
-        click.echo(f"❌ Component not found: {component_name}", err=True)
-        click.echo(f"\n💡 Use 'component list' to see available components")
+        echo(f"❌ Component not found: {component_name}", err=True)
+        echo(f"\n💡 Use 'component list' to see available components")
         sys.exit(1)
     
-    # Read and display file
-    with open(file_path) as f:
-        code = f.read()
+    echo("\n".join((
+        f"📄 Component: {file_path.stem}",
+        f"📁 Category: {file_path.parent.name}",
+        f"📍 Path: {file_path}",
+        RULE,
+    )))
     
-    click.echo(f"📄 Component: {file_path.stem}")
-    click.echo(f"📁 Category: {file_path.parent.name}")
-    click.echo(f"📍 Path: {file_path}")
-    click.echo("=" * 60)
-    click.echo(code)
+    # Stream the file to stdout as-is (no decoded copy of the source)
+    with open(file_path, 'rb') as f:
+        _copy_to_stdout(f)
+    echo("")
 
 
-@cli.command()
-@click.argument('component_name')
-def explain(component_name: str):
+def explain_component(component_name: str):
     """Show integration guide from component docstring.
     
     Examples:
@@ -191,26 +417,26 @@ def explain(component_name: str):
     file_path = find_component_file(component_name)
     
     if not file_path:
-        click.echo(f"❌ Component not found: {component_name}", err=True)
-        click.echo(f"\n💡 Use 'component list' to see available components")
+        echo(f"❌ Component not found: {component_name}", err=True)
+        echo(f"\n💡 Use 'component list' to see available components")
         sys.exit(1)
     
-    # Extract docstring
-    docstring = extract_docstring(file_path)
+    # Docstring comes from the index (parsed once per file change)
+    docstring = get_docstring(file_path)
     
     if not docstring:
-        click.echo(f"⚠️  No integration guide found for: {component_name}")
+        echo(f"⚠️  No integration guide found for: {component_name}")
         return
     
-    click.echo(f"📖 Integration Guide: {file_path.stem}")
-    click.echo(f"📁 Category: {file_path.parent.name}")
-    click.echo("=" * 60)
-    click.echo(docstring)
+    echo("\n".join((
+        f"📖 Integration Guide: {file_path.stem}",
+        f"📁 Category: {file_path.parent.name}",
+        RULE,
+        docstring,
+    )))
 
 
-@cli.command()
-@click.argument('keyword')
-def search(keyword: str):
+def search_components(keyword: str):
     """Search components by keyword in name or docstring.
     
     Examples:
@@ -221,45 +447,140 @@ def search(keyword: str):
     keyword_lower = keyword.lower()
     matches = []
     
-    for category in get_categories():
-        cat_path = COMPONENT_DIR / category
-        for file in cat_path.iterdir():
-            if file.suffix == '.py' and not file.name.startswith('_'):
-                # Check filename
-                if keyword_lower in file.stem.lower():
-                    docstring = extract_docstring(file)
-                    first_line = docstring.split('\n')[0] if docstring else "No description"
-                    matches.append({
-                        'name': file.stem,
-                        'category': category,
-                        'description': first_line
-                    })
-                    continue
-                
-                # Check docstring
-                docstring = extract_docstring(file)
-                if docstring and keyword_lower in docstring.lower():
-                    first_line = docstring.split('\n')[0]
-                    matches.append({
-                        'name': file.stem,
-                        'category': category,
-                        'description': first_line
-                    })
+    # Name hits come from the suffix trie; docstrings are scanned for the rest
+    name_hits = _trie_matches(_load_index_data()['name_trie'], keyword_lower)
+    
+    for category, entry in _load_index().items():
+        for name, component in entry['components'].items():
+            if (category, name) in name_hits or keyword_lower in component['docstring_lower']:
+                docstring = component['docstring']
+                first_line = docstring.partition('\n')[0] if docstring else "No description"
+                matches.append({
+                    'name': name,
+                    'category': category,
+                    'description': first_line
+                })
     
     if not matches:
-        click.echo(f"❌ No components found matching: {keyword}")
+        echo(f"❌ No components found matching: {keyword}")
         return
     
-    click.echo(f"🔍 Search results for: {keyword}")
-    click.echo("=" * 60)
+    out = []
+    emit = out.append
+    emit(f"🔍 Search results for: {keyword}")
+    emit(RULE)
     
     for match in matches:
-        click.echo(f"\n📦 {match['name']}")
-        click.echo(f"   Category: {match['category']}")
-        click.echo(f"   {match['description']}")
+        emit(f"\n📦 {match['name']}")
+        emit(f"   Category: {match['category']}")
+        emit(f"   {match['description']}")
     
-    click.echo(f"\n💡 Use 'component explain COMPONENT' for integration guide")
+    emit(f"\n💡 Use 'component explain COMPONENT' for integration guide")
+    echo("\n".join(out))
+
+
+def reindex_components():
+    """Rebuild the component index (strategy_components/.index.pkl).
+    
+    Other commands refresh stale parts of the index on their own; this
+    forces a full rescan, e.g. to warm a fresh checkout.
+    
+    Examples:
+        component reindex
+    """
+    _invalidate()
+    index = _scan_categories(get_categories())
+    if not _write_index(_index_data(index)):
+        echo(f"❌ Could not write index: {INDEX_FILE}", err=True)
+        sys.exit(1)
+    
+    count = sum(len(entry['components']) for entry in index.values())
+    echo(f"✅ Indexed {count} components in {len(index)} categories: {INDEX_FILE}")
+
+
+# name -> (handler, min args, max args)
+COMMANDS = {
+    'list': (list_components, 0, 1),
+    'show': (show_component, 1, 1),
+    'explain': (explain_component, 1, 1),
+    'search': (search_components, 1, 1),
+    'reindex': (reindex_components, 0, 0),
+}
+
+
+def _copy_to_stdout(f):
+    """Copy an open binary file to stdout: os.sendfile where possible, else buffered."""
+    sys.stdout.flush()
+    offset = 0
+    try:
+        out_fd = sys.stdout.fileno()
+        size = os.fstat(f.fileno()).st_size
+        while offset < size:
+            sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+            if not sent:
+                break
+            offset += sent
+        else:
+            return
+    except (AttributeError, OSError, ValueError):
+        # No sendfile (platform, or stdout is not a real fd): plain copy from where it stopped
+        pass
+    f.seek(offset)
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is None:
+        # Text-only stdout (io.StringIO, a replaced sys.stdout): decode as we go
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for chunk in iter(functools.partial(f.read, 64 * 1024), b''):
+            sys.stdout.write(decoder.decode(chunk))
+        sys.stdout.write(decoder.decode(b'', final=True))
+        sys.stdout.flush()
+        return
+    shutil.copyfileobj(f, out, 64 * 1024)
+    out.flush()
+
+
+def echo(message: str, err: bool = False):
+    """click.echo for plain str messages, without importing click."""
+    stream = sys.stderr if err else sys.stdout
+    stream.write(message + "\n")
+    stream.flush()
+
+
+def build_cli():
+    """The click group (used for --help, options and malformed command lines)."""
+    import click
+
+    @click.group()
+    def cli():
+        """Strategy component library CLI.
+        
+        Browse and integrate reusable strategy components with progressive disclosure.
+        """
+        pass
+
+    cli.command(name='list', help=list_components.__doc__)(
+        click.argument('category', required=False)(list_components))
+    cli.command(name='show', help=show_component.__doc__)(
+        click.argument('component_name')(show_component))
+    cli.command(name='explain', help=explain_component.__doc__)(
+        click.argument('component_name')(explain_component))
+    cli.command(name='search', help=search_components.__doc__)(
+        click.argument('keyword')(search_components))
+    cli.command(name='reindex', help=reindex_components.__doc__)(reindex_components)
+    return cli
+
+
+def main(argv: List[str] = None):
+    """Dispatch plain `component CMD [ARG]` directly; hand anything else to click."""
+    args = sys.argv[1:] if argv is None else argv
+    command = COMMANDS.get(args[0]) if args else None
+    if command and not any(arg.startswith('-') for arg in args[1:]):
+        handler, min_args, max_args = command
+        if min_args <= len(args) - 1 <= max_args:
+            handler(*args[1:])
+            return
+    build_cli()(args)
 
 
 if __name__ == '__main__':
-    cli()
+    main()
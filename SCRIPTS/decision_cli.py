@@ -14,42 +14,327 @@ Progressive Disclosure Pattern (Beyond MCP):
 - 87.5% context reduction vs loading all decision skills
 """
 
-import click
+import functools
 import json
+import math
+import mmap
+import operator
+import os
+import stat
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Callable, List, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Absolute path resolution (Beyond MCP pattern)
 SCRIPT_DIR = Path(__file__).resolve().parent
 
 
 def load_json(file_path: str) -> Dict[str, Any]:
-    """Load JSON file with error handling."""
+    """Load JSON file with error handling.
+
+    Regular files are parsed once per (path, mtime, size) per process, so
+    commands run back to back in one process share the parsed state. The
+    returned dict may be that shared object: treat it as read-only.
+    """
     try:
-        with open(file_path) as f:
-            return json.load(f)
+        st = os.stat(file_path)
+        if stat.S_ISREG(st.st_mode):
+            return _parse_json_cached(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        return _parse_json(file_path)
     except FileNotFoundError:
-        click.echo(f"❌ Error: {file_path} not found", err=True)
+        echo(f"❌ Error: {file_path} not found", err=True)
         sys.exit(1)
     except json.JSONDecodeError as e:
-        click.echo(f"❌ Error: Invalid JSON in {file_path}: {e}", err=True)
+        echo(f"❌ Error: Invalid JSON in {file_path}: {e}", err=True)
         sys.exit(1)
 
 
-@click.group()
-def cli():
-    """Decision framework CLI for autonomous strategy development.
+@functools.lru_cache(maxsize=32)
+def _parse_json_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """_parse_json, memoized; the stat fields in the key invalidate it on change."""
+    return _parse_json(file_path)
+
+
+def _parse_json(file_path: str) -> Dict[str, Any]:
+    """Parse a JSON file (orjson when installed).
 
-    Evaluate results and route to next phase with progressive disclosure.
+    Regular files are memory-mapped and parsed by orjson straight from the
+    mapping, with no intermediate bytes copy; pipes and empty files are read.
     """
-    pass
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if orjson is not None and stat.S_ISREG(st.st_mode) and st.st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    data = mm[:]  # e.g. NaN/Infinity from json.dump; let the stdlib decide
+        else:
+            data = f.read()
+    return json.loads(data)
+
+
+# Thresholds field -> (section of iteration_state['thresholds'], key)
+_THRESHOLD_SOURCES = {
+    'too_perfect_sharpe': ('overfitting_signals', 'too_perfect_sharpe'),
+    'too_few_trades': ('overfitting_signals', 'too_few_trades'),
+    'win_rate_too_high': ('overfitting_signals', 'win_rate_too_high'),
+    'min_sharpe': ('minimum_viable', 'sharpe_ratio'),
+    'min_max_drawdown': ('minimum_viable', 'max_drawdown'),
+    'min_trades': ('minimum_viable', 'min_trades'),
+    'opt_sharpe': ('optimization_worthy', 'sharpe_ratio'),
+    'opt_max_drawdown': ('optimization_worthy', 'max_drawdown'),
+    'opt_min_trades': ('optimization_worthy', 'min_trades'),
+    'prod_sharpe': ('production_ready', 'sharpe_ratio'),
+    'prod_max_drawdown': ('production_ready', 'max_drawdown'),
+    'prod_min_trades': ('production_ready', 'min_trades'),
+}
+
+# id(state dict) -> (state dict, Thresholds); holding the dict keeps its id from being reused
+_THRESHOLDS_MEMO: Dict[int, Tuple[Dict[str, Any], 'Thresholds']] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class Thresholds:
+    """Decision thresholds from iteration_state['thresholds'], flattened once.
+
+    Defaults apply per missing key, exactly as the nested .get() lookups did.
+    """
+    # overfitting_signals
+    too_perfect_sharpe: float = 3.0
+    too_few_trades: int = 10
+    win_rate_too_high: float = 0.80
+    # performance_criteria.minimum_viable
+    min_sharpe: float = 0.0
+    min_max_drawdown: float = 0.35
+    min_trades: int = 20
+    # performance_criteria.optimization_worthy
+    opt_sharpe: float = 0.7
+    opt_max_drawdown: float = 0.30
+    opt_min_trades: int = 30
+    # performance_criteria.production_ready
+    prod_sharpe: float = 1.0
+    prod_max_drawdown: float = 0.20
+    prod_min_trades: int = 50
+    # The raw minimum_viable block, echoed back in ABANDON details
+    minimum_viable: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def for_state(cls, iteration_state: Dict[str, Any]) -> 'Thresholds':
+        """from_state, memoized per state dict.
+
+        load_json hands out the same parsed dict while the file is unchanged,
+        so repeat evaluations in one process flatten the thresholds once.
+        """
+        entry = _THRESHOLDS_MEMO.get(id(iteration_state))
+        if entry is None:
+            if len(_THRESHOLDS_MEMO) >= 32:
+                _THRESHOLDS_MEMO.clear()
+            entry = _THRESHOLDS_MEMO[id(iteration_state)] = (iteration_state, cls.from_state(iteration_state))
+        return entry[1]
+
+    @classmethod
+    def from_state(cls, iteration_state: Dict[str, Any]) -> 'Thresholds':
+        thresholds = iteration_state.get('thresholds', {})
+        perf_criteria = thresholds.get('performance_criteria', {})
+        sections = {
+            'overfitting_signals': thresholds.get('overfitting_signals', {}),
+            'minimum_viable': perf_criteria.get('minimum_viable', {}),
+            'optimization_worthy': perf_criteria.get('optimization_worthy', {}),
+            'production_ready': perf_criteria.get('production_ready', {}),
+        }
+        # Only keys the state sets are passed; the field defaults cover the rest
+        values = {name: sections[section][key]
+                  for name, (section, key) in _THRESHOLD_SOURCES.items() if key in sections[section]}
+        return cls(minimum_viable=sections['minimum_viable'], **values)
+
+    def performance_tier(self, sharpe: float, drawdown: float, num_trades: int) -> str:
+        """Highest tier whose three criteria are all met, else 'below_minimum'.
+
+        The tiers need not be nested, so each is tested in full, best first.
+        """
+        for tier, min_sharpe, max_drawdown, min_trades in (
+                ('production_ready', self.prod_sharpe, self.prod_max_drawdown, self.prod_min_trades),
+                ('optimization_worthy', self.opt_sharpe, self.opt_max_drawdown, self.opt_min_trades),
+                ('minimum_viable', self.min_sharpe, self.min_max_drawdown, self.min_trades)):
+            if sharpe >= min_sharpe and drawdown <= max_drawdown and num_trades >= min_trades:
+                return tier
+        return 'below_minimum'
+
+
+# performance tier -> (decision, reason template over sharpe/drawdown/num_trades)
+DECISION_BY_TIER = {
+    'below_minimum': ('ABANDON_HYPOTHESIS',
+                      "Poor performance: Sharpe={sharpe:.2f}, DD={drawdown:.1%}. Below minimum thresholds."),
+    'minimum_viable': ('PROCEED_TO_VALIDATION',
+                       "Marginal performance (Sharpe={sharpe:.2f}). Skipping optimization, validate as-is."),
+    'optimization_worthy': ('PROCEED_TO_OPTIMIZATION',
+                            "Good performance (Sharpe={sharpe:.2f}), but can optimize. Parameters need tuning."),
+    'production_ready': ('PROCEED_TO_VALIDATION',
+                         "Excellent performance: Sharpe={sharpe:.2f}, DD={drawdown:.1%}, Trades={num_trades}. "
+                         "Skip optimization."),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """One row of an evaluation ladder: the first rule whose condition holds decides.
+
+    reason is a str.format template over the metrics; details copies the
+    named metrics and then adds the fixed extra entries.
+    """
+    when: Callable[[Dict[str, Any], Thresholds], bool]
+    decision: str
+    reason: str
+    details: Tuple[str, ...]
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+def run_evaluation(rules: Tuple[Rule, ...], metrics: Dict[str, Any],
+                   t: Optional[Thresholds] = None) -> Tuple[str, str, Dict[str, Any]]:
+    """(decision, reason, details) from the first matching rule (the last is a catch-all).
+
+    t may be None when no rule reads thresholds (OPTIMIZATION_RULES).
+    """
+    for rule in rules:
+        if rule.when(metrics, t):
+            break
+    details = {key: metrics[key] for key in rule.details}
+    details.update(rule.extra)
+    return rule.decision, rule.reason.format(**metrics), details
+
+
+_GAINS = ('improvement', 'baseline_sharpe', 'best_sharpe')
+
+OPTIMIZATION_RULES = (
+    Rule(lambda m, t: m['sensitivity'] > 0.5, 'PROCEED_WITH_ROBUST_PARAMS',
+         "High parameter sensitivity ({sensitivity:.2f}). Using robust parameters (median of top 25%).",
+         _GAINS + ('sensitivity',), {'warning': 'fragile_parameters'}),
+    # Less than 5% improvement
+    Rule(lambda m, t: m['improvement'] < 0.05, 'USE_BASELINE_PARAMS',
+         "Optimization yielded minimal improvement ({improvement:.1%}). Proceeding with baseline parameters.",
+         _GAINS),
+    # More than 30% improvement - suspicious
+    Rule(lambda m, t: m['improvement'] > 0.30, 'ESCALATE_TO_HUMAN',
+         "Optimization yielded suspiciously large improvement ({improvement:.1%}). Manual review recommended.",
+         _GAINS, {'warning': 'suspicious_improvement'}),
+    # Reasonable improvement (5-30%)
+    Rule(lambda m, t: True, 'PROCEED_TO_VALIDATION',
+         "Optimization improved performance by {improvement:.1%}. Using optimized parameters.",
+         _GAINS + ('best_parameters',)),
+)
+
+_GENERALIZATION = ('in_sample_sharpe', 'out_of_sample_sharpe', 'degradation_pct', 'robustness_score')
+
+VALIDATION_RULES = (
+    # More than 40% degradation
+    Rule(lambda m, t: m['degradation_pct'] > 0.40, 'ABANDON_HYPOTHESIS',
+         "OVERFITTING DETECTED: Out-of-sample Sharpe degraded by {degradation_pct:.1%}. Strategy does not generalize.",
+         _GENERALIZATION),
+    # 30-40% degradation
+    Rule(lambda m, t: m['degradation_pct'] > 0.30 and m['oos_meets_minimum'], 'ESCALATE_TO_HUMAN',
+         "Significant degradation ({degradation_pct:.1%}), but OOS meets minimum. Human review needed.",
+         _GENERALIZATION, {'oos_meets_minimum': True}),
+    Rule(lambda m, t: m['degradation_pct'] > 0.30, 'ABANDON_HYPOTHESIS',
+         "Significant degradation ({degradation_pct:.1%}) and OOS below minimum criteria.",
+         _GENERALIZATION, {'oos_meets_minimum': False}),
+    # 15-30% degradation
+    Rule(lambda m, t: m['degradation_pct'] > 0.15, 'PROCEED_WITH_CAUTION',
+         "Moderate degradation ({degradation_pct:.1%}). Deploy but monitor closely.",
+         _GENERALIZATION),
+    # Less than 15% degradation - excellent generalization
+    Rule(lambda m, t: m['out_of_sample_sharpe'] >= t.prod_sharpe, 'DEPLOY_STRATEGY',
+         "Excellent validation: {degradation_pct:.1%} degradation, OOS Sharpe={out_of_sample_sharpe:.2f}. "
+         "Ready for production!",
+         _GENERALIZATION, {'production_ready': True}),
+    Rule(lambda m, t: True, 'PROCEED_WITH_CAUTION',
+         "Good validation ({degradation_pct:.1%} degradation), but OOS Sharpe below production criteria.",
+         _GENERALIZATION, {'production_ready': False}),
+)
+
+
+# Overfitting checks in priority order: (signal / Thresholds field, metric, test, decision, reason)
+OVERFIT_RULES = (
+    ('too_perfect_sharpe', 'sharpe', operator.gt, 'ESCALATE_TO_HUMAN',
+     "OVERFITTING ALERT: Sharpe {value:.2f} is suspiciously high (>{threshold})"),
+    ('too_few_trades', 'num_trades', operator.lt, 'ABANDON_HYPOTHESIS',
+     "Too few trades ({value} < {threshold}). Insufficient sample size."),
+    ('win_rate_too_high', 'win_rate', operator.gt, 'ESCALATE_TO_HUMAN',
+     "OVERFITTING ALERT: Win rate {value:.1%} is suspiciously high"),
+)
+
+
+def _abandon_route(next_action: str, hypothesis_status: str):
+    """Route back to research; the state update needs the next iteration number."""
+    return lambda iteration: {
+        'next_phase': 'research',
+        'next_action': next_action,
+        'update_state': {
+            'current_phase': 'research',
+            'iteration': iteration + 1,
+            'hypothesis_status': hypothesis_status
+        }
+    }
+
+
+def _escalate_route(next_action: str) -> Dict[str, Any]:
+    """Pause for human review."""
+    return {
+        'next_phase': 'paused',
+        'next_action': next_action,
+        'update_state': {'current_phase': 'awaiting_human'}
+    }
+
+
+_TO_VALIDATION = {
+    'next_phase': 'validation',
+    'next_action': 'Run walk-forward validation',
+    'update_state': {'current_phase': 'validation'}
+}
+
+
+def _deploy_route(deployment_status: str) -> Dict[str, Any]:
+    """Hand the validated strategy off for deployment."""
+    return {
+        'next_phase': 'deployed',
+        'next_action': 'Document strategy and prepare for deployment',
+        'update_state': {
+            'current_phase': 'deployed',
+            'deployment_status': deployment_status
+        }
+    }
+
+
+# (phase, decision) -> routing dict, or a callable taking the iteration number.
+# Built once at import; route() only reads (and prints) these, never mutates them.
+ROUTES = {
+    ('backtest', 'PROCEED_TO_OPTIMIZATION'): {
+        'next_phase': 'optimization',
+        'next_action': 'Run parameter optimization',
+        'update_state': {'current_phase': 'optimization'}
+    },
+    ('backtest', 'PROCEED_TO_VALIDATION'): _TO_VALIDATION,
+    ('backtest', 'ABANDON_HYPOTHESIS'): _abandon_route('Select next hypothesis or generate new ones', 'abandoned'),
+    ('backtest', 'ESCALATE_TO_HUMAN'): _escalate_route('Request human guidance'),
+
+    ('optimization', 'PROCEED_TO_VALIDATION'): {**_TO_VALIDATION, 'use_optimized_params': True},
+    ('optimization', 'USE_BASELINE_PARAMS'): {**_TO_VALIDATION, 'use_optimized_params': False},
+    ('optimization', 'PROCEED_WITH_ROBUST_PARAMS'): {**_TO_VALIDATION, 'use_optimized_params': True},
+    ('optimization', 'ESCALATE_TO_HUMAN'): _escalate_route('Request human guidance on optimization results'),
+
+    ('validation', 'DEPLOY_STRATEGY'): _deploy_route('ready'),
+    ('validation', 'PROCEED_WITH_CAUTION'): _deploy_route('caution'),
+    ('validation', 'ABANDON_HYPOTHESIS'): _abandon_route('Select next hypothesis', 'failed_validation'),
+    ('validation', 'ESCALATE_TO_HUMAN'): _escalate_route('Request human guidance on validation results'),
+}
 
 
-@cli.command()
-@click.option('--results', required=True, help='Path to backtest results JSON')
-@click.option('--state', default='iteration_state.json', help='Path to iteration state JSON')
-@click.option('--json', 'output_json', is_flag=True, help='Output as JSON')
 def evaluate_backtest(results: str, state: str, output_json: bool):
     """Evaluate backtest results and make Phase 3 decision.
 
@@ -69,9 +354,7 @@ def evaluate_backtest(results: str, state: str, output_json: bool):
     iteration_state = load_json(state)
 
     # Get thresholds
-    thresholds = iteration_state.get('thresholds', {})
-    perf_criteria = thresholds.get('performance_criteria', {})
-    overfit_signals = thresholds.get('overfitting_signals', {})
+    t = Thresholds.for_state(iteration_state)
 
     # Check for technical failures
     if backtest_results.get('status') == 'error':
@@ -88,100 +371,33 @@ def evaluate_backtest(results: str, state: str, output_json: bool):
     num_trades = backtest_results.get('total_trades', 0)
     win_rate = backtest_results.get('win_rate', 0.0)
 
-    # Check for overfitting signals
-    if sharpe > overfit_signals.get('too_perfect_sharpe', 3.0):
-        decision = 'ESCALATE_TO_HUMAN'
-        reason = f"OVERFITTING ALERT: Sharpe {sharpe:.2f} is suspiciously high (>{overfit_signals.get('too_perfect_sharpe', 3.0)})"
-        details = {'overfitting_signal': 'too_perfect_sharpe', 'sharpe': sharpe}
-        output_decision(decision, reason, details, output_json)
-        return
-
-    if num_trades < overfit_signals.get('too_few_trades', 10):
-        decision = 'ABANDON_HYPOTHESIS'
-        reason = f"Too few trades ({num_trades} < {overfit_signals.get('too_few_trades', 10)}). Insufficient sample size."
-        details = {'overfitting_signal': 'too_few_trades', 'num_trades': num_trades}
-        output_decision(decision, reason, details, output_json)
-        return
-
-    if win_rate > overfit_signals.get('win_rate_too_high', 0.80):
-        decision = 'ESCALATE_TO_HUMAN'
-        reason = f"OVERFITTING ALERT: Win rate {win_rate:.1%} is suspiciously high"
-        details = {'overfitting_signal': 'win_rate_too_high', 'win_rate': win_rate}
-        output_decision(decision, reason, details, output_json)
-        return
+    # Check for overfitting signals. Most backtests trip none, so one combined
+    # test gates the rules table; it only runs to pick which signal fired.
+    if sharpe > t.too_perfect_sharpe or num_trades < t.too_few_trades or win_rate > t.win_rate_too_high:
+        metrics = {'sharpe': sharpe, 'num_trades': num_trades, 'win_rate': win_rate}
+        for signal, metric, exceeds, decision, reason in OVERFIT_RULES:
+            value, threshold = metrics[metric], getattr(t, signal)
+            if exceeds(value, threshold):
+                details = {'overfitting_signal': signal, metric: value}
+                output_decision(decision, reason.format(value=value, threshold=threshold), details, output_json)
+                return
 
     # Performance categorization
-    min_viable = perf_criteria.get('minimum_viable', {})
-    opt_worthy = perf_criteria.get('optimization_worthy', {})
-    prod_ready = perf_criteria.get('production_ready', {})
-
-    meets_minimum = (
-        sharpe >= min_viable.get('sharpe_ratio', 0.0) and
-        drawdown <= min_viable.get('max_drawdown', 0.35) and
-        num_trades >= min_viable.get('min_trades', 20)
-    )
-
-    meets_optimization = (
-        sharpe >= opt_worthy.get('sharpe_ratio', 0.7) and
-        drawdown <= opt_worthy.get('max_drawdown', 0.30) and
-        num_trades >= opt_worthy.get('min_trades', 30)
-    )
-
-    meets_production = (
-        sharpe >= prod_ready.get('sharpe_ratio', 1.0) and
-        drawdown <= prod_ready.get('max_drawdown', 0.20) and
-        num_trades >= prod_ready.get('min_trades', 50)
-    )
-
-    # Decision logic
-    if meets_production:
-        decision = 'PROCEED_TO_VALIDATION'
-        reason = f"Excellent performance: Sharpe={sharpe:.2f}, DD={drawdown:.1%}, Trades={num_trades}. Skip optimization."
-        details = {
-            'performance_tier': 'production_ready',
-            'sharpe': sharpe,
-            'drawdown': drawdown,
-            'num_trades': num_trades
-        }
-
-    elif meets_optimization:
-        decision = 'PROCEED_TO_OPTIMIZATION'
-        reason = f"Good performance (Sharpe={sharpe:.2f}), but can optimize. Parameters need tuning."
-        details = {
-            'performance_tier': 'optimization_worthy',
-            'sharpe': sharpe,
-            'drawdown': drawdown,
-            'num_trades': num_trades
-        }
-
-    elif meets_minimum:
-        decision = 'PROCEED_TO_VALIDATION'
-        reason = f"Marginal performance (Sharpe={sharpe:.2f}). Skipping optimization, validate as-is."
-        details = {
-            'performance_tier': 'minimum_viable',
-            'sharpe': sharpe,
-            'drawdown': drawdown,
-            'num_trades': num_trades
-        }
-
-    else:
-        decision = 'ABANDON_HYPOTHESIS'
-        reason = f"Poor performance: Sharpe={sharpe:.2f}, DD={drawdown:.1%}. Below minimum thresholds."
-        details = {
-            'performance_tier': 'below_minimum',
-            'sharpe': sharpe,
-            'drawdown': drawdown,
-            'num_trades': num_trades,
-            'minimum_required': min_viable
-        }
+    tier = t.performance_tier(sharpe, drawdown, num_trades)
+    decision, reason = DECISION_BY_TIER[tier]
+    reason = reason.format(sharpe=sharpe, drawdown=drawdown, num_trades=num_trades)
+    details = {
+        'performance_tier': tier,
+        'sharpe': sharpe,
+        'drawdown': drawdown,
+        'num_trades': num_trades
+    }
+    if tier == 'below_minimum':
+        details['minimum_required'] = t.minimum_viable
 
     output_decision(decision, reason, details, output_json)
 
 
-@cli.command()
-@click.option('--results', required=True, help='Path to optimization results JSON')
-@click.option('--state', default='iteration_state.json', help='Path to iteration state JSON')
-@click.option('--json', 'output_json', is_flag=True, help='Output as JSON')
 def evaluate_optimization(results: str, state: str, output_json: bool):
     """Evaluate optimization results and make Phase 4 decision.
 
@@ -215,54 +431,18 @@ def evaluate_optimization(results: str, state: str, output_json: bool):
     # Check parameter sensitivity (if available)
     parameter_sensitivity = opt_results.get('parameter_sensitivity', 0.0)
 
-    # Decision logic
-    if parameter_sensitivity > 0.5:
-        decision = 'PROCEED_WITH_ROBUST_PARAMS'
-        reason = f"High parameter sensitivity ({parameter_sensitivity:.2f}). Using robust parameters (median of top 25%)."
-        details = {
-            'improvement': improvement,
-            'baseline_sharpe': baseline_sharpe,
-            'best_sharpe': best_sharpe,
-            'sensitivity': parameter_sensitivity,
-            'warning': 'fragile_parameters'
-        }
-
-    elif improvement < 0.05:  # Less than 5% improvement
-        decision = 'USE_BASELINE_PARAMS'
-        reason = f"Optimization yielded minimal improvement ({improvement*100:.1f}%). Proceeding with baseline parameters."
-        details = {
-            'improvement': improvement,
-            'baseline_sharpe': baseline_sharpe,
-            'best_sharpe': best_sharpe
-        }
-
-    elif improvement > 0.30:  # More than 30% improvement - suspicious
-        decision = 'ESCALATE_TO_HUMAN'
-        reason = f"Optimization yielded suspiciously large improvement ({improvement*100:.1f}%). Manual review recommended."
-        details = {
-            'improvement': improvement,
-            'baseline_sharpe': baseline_sharpe,
-            'best_sharpe': best_sharpe,
-            'warning': 'suspicious_improvement'
-        }
-
-    else:  # Reasonable improvement (5-30%)
-        decision = 'PROCEED_TO_VALIDATION'
-        reason = f"Optimization improved performance by {improvement*100:.1f}%. Using optimized parameters."
-        details = {
-            'improvement': improvement,
-            'baseline_sharpe': baseline_sharpe,
-            'best_sharpe': best_sharpe,
-            'best_parameters': best_params
-        }
+    metrics = {
+        'improvement': improvement,
+        'baseline_sharpe': baseline_sharpe,
+        'best_sharpe': best_sharpe,
+        'sensitivity': parameter_sensitivity,
+        'best_parameters': best_params
+    }
+    decision, reason, details = run_evaluation(OPTIMIZATION_RULES, metrics)
 
     output_decision(decision, reason, details, output_json)
 
 
-@cli.command()
-@click.option('--results', required=True, help='Path to validation results JSON')
-@click.option('--state', default='iteration_state.json', help='Path to iteration state JSON')
-@click.option('--json', 'output_json', is_flag=True, help='Output as JSON')
 def evaluate_validation(results: str, state: str, output_json: bool):
     """Evaluate validation results and make Phase 5 decision.
 
@@ -281,8 +461,7 @@ def evaluate_validation(results: str, state: str, output_json: bool):
     iteration_state = load_json(state)
 
     # Get thresholds
-    thresholds = iteration_state.get('thresholds', {})
-    perf_criteria = thresholds.get('performance_criteria', {})
+    t = Thresholds.for_state(iteration_state)
 
     # Extract metrics
     in_sample_sharpe = val_results.get('in_sample', {}).get('sharpe_ratio', 0.0)
@@ -300,87 +479,23 @@ def evaluate_validation(results: str, state: str, output_json: bool):
             robustness_score = calc_robustness
 
     # Check OOS meets minimum criteria
-    min_viable = perf_criteria.get('minimum_viable', {})
     oos_meets_minimum = (
-        out_of_sample_sharpe >= min_viable.get('sharpe_ratio', 0.0) and
-        abs(val_results.get('out_of_sample', {}).get('max_drawdown', 1.0)) <= min_viable.get('max_drawdown', 0.35)
+        out_of_sample_sharpe >= t.min_sharpe and
+        abs(val_results.get('out_of_sample', {}).get('max_drawdown', 1.0)) <= t.min_max_drawdown
     )
 
-    # Decision logic
-    if degradation_pct > 0.40:  # More than 40% degradation
-        decision = 'ABANDON_HYPOTHESIS'
-        reason = f"OVERFITTING DETECTED: Out-of-sample Sharpe degraded by {degradation_pct*100:.1f}%. Strategy does not generalize."
-        details = {
-            'in_sample_sharpe': in_sample_sharpe,
-            'out_of_sample_sharpe': out_of_sample_sharpe,
-            'degradation_pct': degradation_pct,
-            'robustness_score': robustness_score
-        }
-
-    elif degradation_pct > 0.30:  # 30-40% degradation
-        if oos_meets_minimum:
-            decision = 'ESCALATE_TO_HUMAN'
-            reason = f"Significant degradation ({degradation_pct*100:.1f}%), but OOS meets minimum. Human review needed."
-            details = {
-                'in_sample_sharpe': in_sample_sharpe,
-                'out_of_sample_sharpe': out_of_sample_sharpe,
-                'degradation_pct': degradation_pct,
-                'robustness_score': robustness_score,
-                'oos_meets_minimum': True
-            }
-        else:
-            decision = 'ABANDON_HYPOTHESIS'
-            reason = f"Significant degradation ({degradation_pct*100:.1f}%) and OOS below minimum criteria."
-            details = {
-                'in_sample_sharpe': in_sample_sharpe,
-                'out_of_sample_sharpe': out_of_sample_sharpe,
-                'degradation_pct': degradation_pct,
-                'robustness_score': robustness_score,
-                'oos_meets_minimum': False
-            }
-
-    elif degradation_pct > 0.15:  # 15-30% degradation
-        decision = 'PROCEED_WITH_CAUTION'
-        reason = f"Moderate degradation ({degradation_pct*100:.1f}%). Deploy but monitor closely."
-        details = {
-            'in_sample_sharpe': in_sample_sharpe,
-            'out_of_sample_sharpe': out_of_sample_sharpe,
-            'degradation_pct': degradation_pct,
-            'robustness_score': robustness_score
-        }
-
-    else:  # Less than 15% degradation - excellent generalization
-        prod_ready_sharpe = perf_criteria.get('production_ready', {}).get('sharpe_ratio', 1.0)
-
-        if out_of_sample_sharpe >= prod_ready_sharpe:
-            decision = 'DEPLOY_STRATEGY'
-            reason = f"Excellent validation: {degradation_pct*100:.1f}% degradation, OOS Sharpe={out_of_sample_sharpe:.2f}. Ready for production!"
-            details = {
-                'in_sample_sharpe': in_sample_sharpe,
-                'out_of_sample_sharpe': out_of_sample_sharpe,
-                'degradation_pct': degradation_pct,
-                'robustness_score': robustness_score,
-                'production_ready': True
-            }
-        else:
-            decision = 'PROCEED_WITH_CAUTION'
-            reason = f"Good validation ({degradation_pct*100:.1f}% degradation), but OOS Sharpe below production criteria."
-            details = {
-                'in_sample_sharpe': in_sample_sharpe,
-                'out_of_sample_sharpe': out_of_sample_sharpe,
-                'degradation_pct': degradation_pct,
-                'robustness_score': robustness_score,
-                'production_ready': False
-            }
+    metrics = {
+        'in_sample_sharpe': in_sample_sharpe,
+        'out_of_sample_sharpe': out_of_sample_sharpe,
+        'degradation_pct': degradation_pct,
+        'robustness_score': robustness_score,
+        'oos_meets_minimum': oos_meets_minimum
+    }
+    decision, reason, details = run_evaluation(VALIDATION_RULES, metrics, t)
 
     output_decision(decision, reason, details, output_json)
 
 
-@cli.command()
-@click.option('--phase', required=True, type=click.Choice(['backtest', 'optimization', 'validation']), help='Current phase')
-@click.option('--decision', required=True, help='Decision from evaluate-* command')
-@click.option('--iteration', type=int, default=1, help='Current iteration number')
-@click.option('--json', 'output_json', is_flag=True, help='Output as JSON')
 def route(phase: str, decision: str, iteration: int, output_json: bool):
     """Route to next phase based on current phase and decision.
 
@@ -388,108 +503,37 @@ def route(phase: str, decision: str, iteration: int, output_json: bool):
         decision route --phase backtest --decision PROCEED_TO_OPTIMIZATION --iteration 1
         decision route --phase validation --decision DEPLOY_STRATEGY --iteration 1 --json
     """
-    routing = {}
-
-    # Backtest phase routing
-    if phase == 'backtest':
-        if decision == 'PROCEED_TO_OPTIMIZATION':
-            routing = {
-                'next_phase': 'optimization',
-                'next_action': 'Run parameter optimization',
-                'update_state': {'current_phase': 'optimization'}
-            }
-        elif decision == 'PROCEED_TO_VALIDATION':
-            routing = {
-                'next_phase': 'validation',
-                'next_action': 'Run walk-forward validation',
-                'update_state': {'current_phase': 'validation'}
-            }
-        elif decision == 'ABANDON_HYPOTHESIS':
-            routing = {
-                'next_phase': 'research',
-                'next_action': 'Select next hypothesis or generate new ones',
-                'update_state': {
-                    'current_phase': 'research',
-                    'iteration': iteration + 1,
-                    'hypothesis_status': 'abandoned'
-                }
-            }
-        elif decision == 'ESCALATE_TO_HUMAN':
-            routing = {
-                'next_phase': 'paused',
-                'next_action': 'Request human guidance',
-                'update_state': {'current_phase': 'awaiting_human'}
-            }
-        else:
-            routing = {
-                'error': f'Unknown decision: {decision} for phase: {phase}'
-            }
-
-    # Optimization phase routing
-    elif phase == 'optimization':
-        if decision in ['PROCEED_TO_VALIDATION', 'USE_BASELINE_PARAMS', 'PROCEED_WITH_ROBUST_PARAMS']:
-            routing = {
-                'next_phase': 'validation',
-                'next_action': 'Run walk-forward validation',
-                'update_state': {'current_phase': 'validation'},
-                'use_optimized_params': decision != 'USE_BASELINE_PARAMS'
-            }
-        elif decision == 'ESCALATE_TO_HUMAN':
-            routing = {
-                'next_phase': 'paused',
-                'next_action': 'Request human guidance on optimization results',
-                'update_state': {'current_phase': 'awaiting_human'}
-            }
-        else:
-            routing = {
-                'error': f'Unknown decision: {decision} for phase: {phase}'
-            }
-
-    # Validation phase routing
-    elif phase == 'validation':
-        if decision in ['DEPLOY_STRATEGY', 'PROCEED_WITH_CAUTION']:
-            routing = {
-                'next_phase': 'deployed',
-                'next_action': 'Document strategy and prepare for deployment',
-                'update_state': {
-                    'current_phase': 'deployed',
-                    'deployment_status': 'ready' if decision == 'DEPLOY_STRATEGY' else 'caution'
-                }
-            }
-        elif decision == 'ABANDON_HYPOTHESIS':
-            routing = {
-                'next_phase': 'research',
-                'next_action': 'Select next hypothesis',
-                'update_state': {
-                    'current_phase': 'research',
-                    'iteration': iteration + 1,
-                    'hypothesis_status': 'failed_validation'
-                }
-            }
-        elif decision == 'ESCALATE_TO_HUMAN':
-            routing = {
-                'next_phase': 'paused',
-                'next_action': 'Request human guidance on validation results',
-                'update_state': {'current_phase': 'awaiting_human'}
-            }
-        else:
-            routing = {
-                'error': f'Unknown decision: {decision} for phase: {phase}'
-            }
+    routing = ROUTES.get((phase, decision))
+    if routing is None:
+        routing = {'error': f'Unknown decision: {decision} for phase: {phase}'}
+    elif callable(routing):
+        routing = routing(iteration)
 
     # Output routing
     if output_json:
-        click.echo(json.dumps(routing, indent=2))
+        echo_json(routing)
     else:
         if 'error' in routing:
-            click.echo(f"❌ {routing['error']}", err=True)
+            echo(f"❌ {routing['error']}", err=True)
             sys.exit(1)
         else:
-            click.echo(f"🔀 Routing Decision:")
-            click.echo(f"   Current Phase: {phase}")
-            click.echo(f"   Decision: {decision}")
-            click.echo(f"   Next Phase: {routing['next_phase']}")
-            click.echo(f"   Next Action: {routing['next_action']}")
+            echo("🔀 Routing Decision:\n"
+                 f"   Current Phase: {phase}\n"
+                 f"   Decision: {decision}\n"
+                 f"   Next Phase: {routing['next_phase']}\n"
+                 f"   Next Action: {routing['next_action']}")
+
+
+EMOJI_MAP = {
+    'PROCEED_TO_OPTIMIZATION': '🔧',
+    'PROCEED_TO_VALIDATION': '✅',
+    'ABANDON_HYPOTHESIS': '❌',
+    'ESCALATE_TO_HUMAN': '👤',
+    'USE_BASELINE_PARAMS': '📊',
+    'PROCEED_WITH_ROBUST_PARAMS': '🛡️',
+    'DEPLOY_STRATEGY': '🚀',
+    'PROCEED_WITH_CAUTION': '⚠️'
+}
 
 
 def output_decision(decision: str, reason: str, details: Dict[str, Any], output_json: bool):
@@ -500,36 +544,154 @@ def output_decision(decision: str, reason: str, details: Dict[str, Any], output_
             'reason': reason,
             'details': details
         }
-        click.echo(json.dumps(result, indent=2))
-    else:
-        # Emoji based on decision
-        emoji_map = {
-            'PROCEED_TO_OPTIMIZATION': '🔧',
-            'PROCEED_TO_VALIDATION': '✅',
-            'ABANDON_HYPOTHESIS': '❌',
-            'ESCALATE_TO_HUMAN': '👤',
-            'USE_BASELINE_PARAMS': '📊',
-            'PROCEED_WITH_ROBUST_PARAMS': '🛡️',
-            'DEPLOY_STRATEGY': '🚀',
-            'PROCEED_WITH_CAUTION': '⚠️'
-        }
-        emoji = emoji_map.get(decision, '🤖')
-
-        click.echo(f"{emoji} Decision: {decision}")
-        click.echo(f"   Reason: {reason}")
+        echo_json(result)
+        return
 
-        # Show key metrics from details
-        if 'sharpe' in details:
-            click.echo(f"   Sharpe Ratio: {details['sharpe']:.2f}")
-        if 'drawdown' in details:
-            click.echo(f"   Max Drawdown: {details['drawdown']:.1%}")
-        if 'num_trades' in details:
-            click.echo(f"   Total Trades: {details['num_trades']}")
-        if 'improvement' in details:
-            click.echo(f"   Improvement: {details['improvement']*100:.1f}%")
-        if 'degradation_pct' in details:
-            click.echo(f"   Degradation: {details['degradation_pct']*100:.1f}%")
+    lines = [f"{EMOJI_MAP.get(decision, '🤖')} Decision: {decision}",
+             f"   Reason: {reason}"]
+
+    # Show key metrics from details
+    if 'sharpe' in details:
+        lines.append(f"   Sharpe Ratio: {details['sharpe']:.2f}")
+    if 'drawdown' in details:
+        lines.append(f"   Max Drawdown: {details['drawdown']:.1%}")
+    if 'num_trades' in details:
+        lines.append(f"   Total Trades: {details['num_trades']}")
+    if 'improvement' in details:
+        lines.append(f"   Improvement: {details['improvement']*100:.1f}%")
+    if 'degradation_pct' in details:
+        lines.append(f"   Degradation: {details['degradation_pct']*100:.1f}%")
+    echo("\n".join(lines))
+
+
+def echo(message: str, err: bool = False):
+    """click.echo for plain str messages, without importing click."""
+    stream = sys.stderr if err else sys.stdout
+    stream.write(message + "\n")
+    stream.flush()
+
+
+def _finite(obj: Any) -> Any:
+    """obj with NaN/Infinity floats replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def echo_json(obj: Any):
+    """Write obj as indented UTF-8 JSON, with NaN/Infinity as null.
+
+    orjson does this natively; the json.dumps fallback (orjson missing, or a
+    value it rejects such as an int beyond 64 bits) is made to agree, so
+    --json output means the same with or without orjson.
+    """
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    if data is None:
+        data = json.dumps(_finite(obj), indent=2, ensure_ascii=False).encode('utf-8') + b"\n"
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
+PHASES = ('backtest', 'optimization', 'validation')
+
+
+def _phase(value: str) -> str:
+    if value not in PHASES:
+        raise ValueError(value)
+    return value
+
+
+_EVALUATE_OPTIONS = {'--results': ('results', str), '--state': ('state', str)}
+_EVALUATE_DEFAULTS = {'results': None, 'state': 'iteration_state.json', 'output_json': False}
+
+# name -> (handler, {--option: (param, converter)}, defaults); None marks a required option
+COMMANDS = {
+    'evaluate-backtest': (evaluate_backtest, _EVALUATE_OPTIONS, _EVALUATE_DEFAULTS),
+    'evaluate-optimization': (evaluate_optimization, _EVALUATE_OPTIONS, _EVALUATE_DEFAULTS),
+    'evaluate-validation': (evaluate_validation, _EVALUATE_OPTIONS, _EVALUATE_DEFAULTS),
+    'route': (route,
+              {'--phase': ('phase', _phase), '--decision': ('decision', str), '--iteration': ('iteration', int)},
+              {'phase': None, 'decision': None, 'iteration': 1, 'output_json': False}),
+}
+
+
+def _parse_args(args: List[str]) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """(handler, kwargs) for a well-formed command line, else None."""
+    command = COMMANDS.get(args[0]) if args else None
+    if command is None:
+        return None
+    handler, options, defaults = command
+    kwargs = dict(defaults)
+    rest = iter(args[1:])
+    for arg in rest:
+        if arg == '--json':
+            kwargs['output_json'] = True
+            continue
+        name, eq, value = arg.partition('=')
+        if name not in options:
+            return None
+        if not eq:
+            value = next(rest, None)
+            if value is None or value.startswith('-'):
+                return None
+        param, convert = options[name]
+        try:
+            kwargs[param] = convert(value)
+        except ValueError:
+            return None
+    if any(value is None for value in kwargs.values()):
+        return None
+    return handler, kwargs
+
+
+def build_cli():
+    """The click group (used for --help and malformed command lines)."""
+    import click
+
+    @click.group()
+    def cli():
+        """Decision framework CLI for autonomous strategy development.
+
+        Evaluate results and route to next phase with progressive disclosure.
+        """
+        pass
+
+    json_flag = click.option('--json', 'output_json', is_flag=True, help='Output as JSON')
+    state = click.option('--state', default='iteration_state.json', help='Path to iteration state JSON')
+    for name, handler, kind in (('evaluate-backtest', evaluate_backtest, 'backtest'),
+                                ('evaluate-optimization', evaluate_optimization, 'optimization'),
+                                ('evaluate-validation', evaluate_validation, 'validation')):
+        results = click.option('--results', required=True, help=f'Path to {kind} results JSON')
+        cli.command(name=name, help=handler.__doc__)(results(state(json_flag(handler))))
+
+    cli.command(name='route', help=route.__doc__)(
+        click.option('--phase', required=True, type=click.Choice(PHASES), help='Current phase')(
+            click.option('--decision', required=True, help='Decision from evaluate-* command')(
+                click.option('--iteration', type=int, default=1, help='Current iteration number')(
+                    json_flag(route)))))
+    return cli
+
+
+def main(argv: List[str] = None):
+    """Dispatch well-formed command lines directly; hand anything else to click."""
+    args = sys.argv[1:] if argv is None else argv
+    parsed = _parse_args(args)
+    if parsed is None:
+        build_cli()(args)
+        return
+    handler, kwargs = parsed
+    handler(**kwargs)
 
 
 if __name__ == '__main__':
-    cli()
+    main()
@@ -18,12 +18,142 @@ Usage:
 """
 
 import json
+import os
+import pickle
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
 
 HELP_DIR = Path(__file__).resolve().parent.parent / "HELP"
 
+# Bump when the cached (post-processed) form of a help file changes
+CACHE_VERSION = 3
+
+
+def _load_cached(help_file: Path, suffix: str, build):
+    """Return build(help_file), cached in a pickle sidecar (<name>.json<suffix>).
+
+    The sidecar holds two pickles: a (CACHE_VERSION, mtime_ns, size) stamp for
+    the JSON file and the built value. It is reused while the stamp matches and
+    rebuilt otherwise.
+    """
+    stat = help_file.stat()
+    stamp = (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    cache_file = help_file.with_name(help_file.name + suffix)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            if pickle.load(f) == stamp:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError,
+            OverflowError, ImportError, MemoryError):
+        pass  # missing or damaged sidecar: rebuild and rewrite it
+
+    value = build(help_file)
+
+    # Best effort: a read-only HELP/ just means no cache
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(stamp, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+    return value
+
+
+def _read_json(help_file: Path) -> Dict:
+    """Parse a help file, intern its repeated identifiers and precompute '_tags_str'.
+
+    The tool name, section IDs and tags repeat across records; interning makes
+    the copies one object (also stored once in the pickle sidecar).
+    """
+    with open(help_file) as f:
+        data = json.load(f)
+
+    if isinstance(data.get('tool'), str):
+        data['tool'] = sys.intern(data['tool'])
+
+    for section in data.get('sections', []):
+        if isinstance(section.get('id'), str):
+            section['id'] = sys.intern(section['id'])
+        if section.get('tags'):
+            section['tags'] = [sys.intern(tag) for tag in section['tags']]
+        section['_tags_str'] = ', '.join(section.get('tags') or ())
+
+    for faq in data.get('faqs', []):
+        if faq.get('tags'):
+            faq['tags'] = [sys.intern(tag) for tag in faq['tags']]
+
+    return data
+
+
+def _load_json_cached(help_file: Path) -> Dict:
+    """Load a help JSON file through its pickle sidecar (<name>.json.pkl)."""
+    return _load_cached(help_file, ".pkl", _read_json)
+
+
+def _postings(texts) -> Dict[str, List[int]]:
+    """Map each lower-cased whitespace-separated word to the indices of the texts containing it."""
+    index = {}
+    for i, text in enumerate(texts):
+        for word in set(text.lower().split()):
+            index.setdefault(word, []).append(i)
+    return index
+
+
+def _word_index(texts) -> Dict:
+    """Postings plus a trigram -> words map over their vocabulary (for substring probes)."""
+    postings = _postings(texts)
+    grams = {}
+    for word in postings:
+        for gram in {word[i:i + 3] for i in range(len(word) - 2)}:
+            grams.setdefault(gram, []).append(word)
+    return {'postings': postings, 'grams': grams}
+
+
+def _build_index(help_file: Path) -> Dict:
+    """Word / trigram indexes over the searchable text of a help file's sections and FAQs."""
+    data = _load_json_cached(help_file)
+    return {
+        'sections': _word_index(f"{s['title']} {s['content']}" for s in data.get('sections', [])),
+        'faqs': _word_index(f"{q['question']} {q['answer']}" for q in data.get('faqs', [])),
+    }
+
+
+def _load_index_cached(help_file: Path) -> Dict:
+    """Load a help file's search index through its pickle sidecar (<name>.json.index.pkl)."""
+    return _load_cached(help_file, ".index.pkl", _build_index)
+
+
+def _candidates(index: Dict, query_lower: str, count: int) -> List[int]:
+    """Positions that can contain query_lower as a substring, in document order.
+
+    A query word has no whitespace, so any match lies inside one indexed word
+    containing the longest query word. Such a word contains each of the probe's
+    trigrams, so the candidate words come from the probe's rarest trigram
+    (a whole-word probe is among them); only probes under three characters
+    scan the vocabulary. Callers still run the substring test on each candidate.
+    """
+    words = query_lower.split()
+    if not words:
+        return list(range(count))
+    probe = max(words, key=len)
+    postings = index['postings']
+    if len(probe) >= 3:
+        grams = index['grams']
+        vocabulary = min((grams.get(probe[i:i + 3], ()) for i in range(len(probe) - 2)), key=len)
+    else:
+        vocabulary = postings
+    hits = set()
+    for word in vocabulary:
+        if probe in word:
+            hits.update(postings[word])
+    return sorted(hits)
+
 
 def load_help(tool_name: str) -> Dict:
     """Load help data from JSON file.
@@ -43,8 +173,7 @@ def load_help(tool_name: str) -> Dict:
     if not help_file.exists():
         raise FileNotFoundError(f"Help file not found: {help_file}")
 
-    with open(help_file) as f:
-        return json.load(f)
+    return _load_json_cached(help_file)
 
 
 def format_help(help_data: Dict, priority: Optional[int] = None) -> str:
@@ -155,12 +284,14 @@ def get_section(help_data: Dict, section_id: str) -> Optional[Dict]:
     return None
 
 
-def search_help(query: str, tags: Optional[List[str]] = None) -> List[Dict]:
+def search_help(query: str, tags: Optional[List[str]] = None,
+                tool: Optional[str] = None) -> List[Dict]:
     """Search across all help files.
 
     Args:
         query: Search query (case-insensitive)
         tags: Optional list of tags to filter by
+        tool: Optional tool name; only HELP/<tool>.json is searched
 
     Returns:
         List of matching results with tool, section, and content
@@ -168,19 +299,30 @@ def search_help(query: str, tags: Optional[List[str]] = None) -> List[Dict]:
     results = []
     query_lower = query.lower()
 
+    # Help files are named after their tool, so a tool filter is a direct lookup
+    if tool:
+        help_files = [HELP_DIR / f"{tool}.json"]
+        if not help_files[0].exists():
+            return results
+    else:
+        help_files = HELP_DIR.glob("*.json")
+
     # Search all help files
-    for help_file in HELP_DIR.glob("*.json"):
+    for help_file in help_files:
         if help_file.name == "schema.json":
             continue
 
         try:
-            with open(help_file) as f:
-                data = json.load(f)
+            data = _load_json_cached(help_file)
 
             tool_name = data['tool']
+            index = _load_index_cached(help_file)
+            sections = data.get('sections', [])
+            faqs = data.get('faqs', [])
 
             # Search sections
-            for section in data.get('sections', []):
+            for i in _candidates(index['sections'], query_lower, len(sections)):
+                section = sections[i]
                 # Tag filter
                 if tags:
                     if not any(tag in section.get('tags', []) for tag in tags):
@@ -200,7 +342,8 @@ def search_help(query: str, tags: Optional[List[str]] = None) -> List[Dict]:
                     })
 
             # Search FAQs
-            for faq in data.get('faqs', []):
+            for i in _candidates(index['faqs'], query_lower, len(faqs)):
+                faq = faqs[i]
                 if (query_lower in faq['question'].lower() or
                     query_lower in faq['answer'].lower()):
 
@@ -97,8 +97,7 @@ def help(section, search, list_sections):
         return
 
     if search:
-        results = search_help(search)
-        results = [r for r in results if r.get('tool') == 'qc_optimize']
+        results = search_help(search, tool='qc_optimize')
 
         if results:
             click.echo(f"\n{'=' * 80}")